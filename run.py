@@ -10,7 +10,7 @@ sys.path.insert(0, str(src_path))
 
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
-from src.batch_window import BatchWindow
+from src.batch_window import BatchWindow, load_app_stylesheet
 from src.translations import tr
 
 def main():
@@ -18,6 +18,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("WiiVC Injector Batch")
     app.setOrganizationName("TeconMoon")
+    app.setStyleSheet(load_app_stylesheet())
 
     # Set application icon
     icon_path = Path(__file__).parent / "resources" / "images" / "icon.png"
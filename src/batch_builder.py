@@ -1,12 +1,11 @@
 """Batch build system for multiple game files."""
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from PyQt5.QtCore import QThread, pyqtSignal
 from .build_engine import BuildEngine
 from .translations import tr
 from .paths import paths
-from .image_utils import image_processor
-import requests
 
 
 class BatchBuildJob:
@@ -32,8 +31,7 @@ class BatchBuildJob:
 class BatchBuilder(QThread):
     """Background thread for batch building multiple games."""
 
-    # Signals
-    progress_updated = pyqtSignal(int, int, str)  # current_index, total, message
+    # Signals (progress is polled with take_progress() rather than signalled)
     job_started = pyqtSignal(int, str)  # index, game_name
     job_finished = pyqtSignal(int, bool, str)  # index, success, message
     all_finished = pyqtSignal(int, int)  # success_count, total_count
@@ -49,6 +47,9 @@ class BatchBuilder(QThread):
         self.keep_temp_for_debug = keep_temp_for_debug
         self.should_stop = False
         self.current_engine = None  # Track current BuildEngine for cancellation
+        # Latest (percent, message) not yet taken by the GUI; older ticks are overwritten
+        self._progress_lock = threading.Lock()
+        self._latest_progress = None
 
     def stop(self):
         """Stop batch processing."""
@@ -57,6 +58,17 @@ class BatchBuilder(QThread):
         if self.current_engine:
             self.current_engine.stop()
 
+    def take_progress(self):
+        """
+        Take the most recent progress update, if there is a new one.
+
+        Returns:
+            (percent, message) tuple, or None if nothing changed since the last call
+        """
+        with self._progress_lock:
+            progress, self._latest_progress = self._latest_progress, None
+        return progress
+
     def run(self):
         """Process all jobs in queue."""
         success_count = 0
@@ -96,6 +108,7 @@ class BatchBuilder(QThread):
 
     def download_icons(self, job: BatchBuildJob, game_id: str):
         """Download icon and banner for game."""
+        import requests  # Deferred: only needed once a build runs
         cucholix_id = game_id[:4] if len(game_id) >= 4 else game_id
 
         # Try different ID variations
@@ -129,12 +142,14 @@ class BatchBuilder(QThread):
 
     def build_job(self, job: BatchBuildJob, idx: int, total: int) -> bool:
         """Build single job."""
+        from .image_utils import image_processor  # Deferred: pulls in PIL
         try:
             def progress_callback(percent, message):
                 # Calculate overall progress: job progress + previous jobs
                 # Each job is worth (100/total)%, current job contributes (percent * 100/total)%
                 overall_percent = int((idx * 100 / total) + (percent / total))
-                self.progress_updated.emit(overall_percent, 100, f"[{idx+1}/{total}] {message}")
+                with self._progress_lock:
+                    self._latest_progress = (overall_percent, f"[{idx+1}/{total}] {message}")
 
             # Process images to cache BEFORE BuildEngine (so they survive cleanup)
             print(f"[IMAGE] Processing images to cache for {job.title_name}")
@@ -1,20 +1,293 @@
 """Batch build window - Simplified UI for mass injection."""
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar,
     QLabel, QCheckBox, QFileDialog, QMessageBox, QLineEdit, QDialog,
-    QFormLayout, QStyle, QProgressDialog, QComboBox, QSizePolicy
+    QFormLayout, QStyle, QProgressDialog, QComboBox, QSizePolicy, QTableView, QApplication
+)
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QSize, QTimer, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, QRect
+)
+from PyQt5.QtGui import (
+    QColor, QPixmap, QIcon, QFont, QBrush, QPalette, QImage, QImageReader, QPainter, QPixmapCache
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt5.QtGui import QColor, QPixmap, QIcon, QFont, QBrush, QPalette
 from .batch_builder import BatchBuilder, BatchBuildJob
+from .build_engine import BuildEngine
 from .game_info import game_info_extractor
-from .compatibility_db import compatibility_db
+from .compatibility_db import get_compatibility_db
 from .paths import paths
 from .translations import tr
 
 
+# User settings file (keys, output folder)
+SETTINGS_FILE = Path.home() / ".meta_injector_settings.json"
+
+# Parsed settings file, keyed by its mtime so external edits are picked up
+_settings_cache = None  # (mtime_ns, settings)
+
+
+def load_settings() -> dict:
+    """
+    Load the settings file, parsing it only when it changed on disk.
+
+    Returns:
+        Copy of the settings dict, empty if there is no settings file
+
+    Raises:
+        OSError, ValueError: If the file can't be read or parsed
+    """
+    global _settings_cache
+    try:
+        mtime = SETTINGS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _settings_cache is None or _settings_cache[0] != mtime:
+        # json.loads takes bytes (UTF-8 detected), no text wrapper needed
+        _settings_cache = (mtime, json.loads(SETTINGS_FILE.read_bytes()))
+    return dict(_settings_cache[1])
+
+
+def save_settings(settings: dict) -> bool:
+    """
+    Write the settings file atomically, skipping the write if nothing changed.
+
+    Args:
+        settings: Complete settings dict to store
+
+    Returns:
+        True if the file was written, False if it was already up to date
+
+    Raises:
+        OSError: If the file can't be written
+    """
+    global _settings_cache
+    try:
+        if load_settings() == settings and SETTINGS_FILE.exists():
+            return False
+    except (OSError, ValueError):
+        pass  # Unreadable file - overwrite it
+
+    tmp_file = SETTINGS_FILE.with_suffix('.tmp')
+    # Serialize in one go; json.dump would issue a write per token
+    tmp_file.write_bytes(json.dumps(settings, indent=2, ensure_ascii=False).encode('utf-8'))
+    os.replace(tmp_file, SETTINGS_FILE)
+    _settings_cache = (SETTINGS_FILE.stat().st_mtime_ns, dict(settings))
+    return True
+
+
+# Region by the 4th game ID character
+REGION_BY_CODE = {'P': 'EUR', 'E': 'USA', 'J': 'JAP', 'K': 'KOR'}
+
+# Title ID high word by system type
+TITLE_ID_PREFIXES = {'gc': '00050002', 'wii': '00050000'}
+
+
+# Options for every file picker: custom directory icons and symlink
+# resolution cost a stat per entry, which is slow on network drives
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
+# Name filters, built once
+GAME_FILE_PATTERNS = "*.iso *.wbfs *.nkit.iso *.iso.dec *.gcm"
+GAME_FILE_FILTER_KO = f"게임 파일 ({GAME_FILE_PATTERNS});;모든 파일 (*.*)"
+GAME_FILE_FILTER_EN = f"Game Files ({GAME_FILE_PATTERNS});;All Files (*.*)"
+IMAGE_FILE_FILTER = "Images (*.png *.jpg *.jpeg);;All Files (*.*)"
+
+# File picker kinds: (Korean title, English title, Korean filter, English filter)
+FILE_DIALOG_SPECS = {
+    'games': ("게임 파일 선택", "Select Game Files", GAME_FILE_FILTER_KO, GAME_FILE_FILTER_EN),
+    'icon': ("아이콘 이미지 선택", "Select Icon Image", IMAGE_FILE_FILTER, IMAGE_FILE_FILTER),
+    'banner': ("배너 이미지 선택", "Select Banner Image", IMAGE_FILE_FILTER, IMAGE_FILE_FILTER),
+}
+
+
+def open_file_dialog(parent, kind: str, multiple: bool = False):
+    """
+    Show the file picker for one of FILE_DIALOG_SPECS.
+
+    Args:
+        parent: Parent widget
+        kind: Key into FILE_DIALOG_SPECS
+        multiple: Allow selecting several files
+
+    Returns:
+        List of selected paths if multiple, else the selected path or "" if cancelled
+    """
+    title_ko, title_en, filter_ko, filter_en = FILE_DIALOG_SPECS[kind]
+    if tr.current_language == "ko":
+        title, name_filter = title_ko, filter_ko
+    else:
+        title, name_filter = title_en, filter_en
+
+    if multiple:
+        selected, _ = QFileDialog.getOpenFileNames(parent, title, "", name_filter, options=FILE_DIALOG_OPTIONS)
+    else:
+        selected, _ = QFileDialog.getOpenFileName(parent, title, "", name_filter, options=FILE_DIALOG_OPTIONS)
+    return selected
+
+
+def load_app_stylesheet() -> str:
+    """
+    Read the application stylesheet (resources/app.qss).
+
+    Widgets opt in to its rules through their objectName and, for badges and
+    required key fields, a dynamic property (see set_style_property).
+
+    Returns:
+        Stylesheet text, or "" if the file is missing
+    """
+    from .resources import resources
+    qss_path = resources.get_resource_path("app.qss")
+    if qss_path is None:
+        print("[WARN] Stylesheet not found: app.qss")
+        return ""
+    return qss_path.read_text(encoding='utf-8')
+
+
+def set_style_property(widget: QWidget, name: str, value: str):
+    """
+    Restyle a widget through an app.qss property selector.
+
+    Args:
+        widget: Widget to restyle
+        name: Dynamic property the stylesheet selects on (e.g. 'state', 'interactive')
+        value: Property value, e.g. 'pending' or 'false'
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    # Property selectors are only re-evaluated on a re-polish
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def set_palette_color(widget: QWidget, role, color: str, pixel_size: int = 0):
+    """
+    Colour a widget through its palette rather than a per-widget stylesheet.
+
+    Args:
+        widget: Widget to colour
+        role: QPalette role, e.g. QPalette.WindowText or QPalette.Base
+        color: Colour name, e.g. '#333'
+        pixel_size: Optional font pixel size to apply alongside the colour
+    """
+    palette = widget.palette()
+    palette.setColor(role, QColor(color))
+    widget.setPalette(palette)
+    if pixel_size:
+        font = widget.font()
+        font.setPixelSize(pixel_size)
+        widget.setFont(font)
+
+
+def make_cell_container(margins: tuple, spacing: int):
+    """
+    Create a transparent widget with a vertical layout for a table cell.
+
+    Args:
+        margins: (left, top, right, bottom) layout margins
+        spacing: Layout spacing
+
+    Returns:
+        (widget, layout) tuple
+    """
+    widget = QWidget()
+    widget.setAttribute(Qt.WA_TranslucentBackground)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    return widget, layout
+
+
+# Fonts built once and shared, keyed by (pixel_size, point_size, bold)
+_fonts = {}
+
+
+def cached_font(pixel_size: int = 0, point_size: int = 0, bold: bool = False) -> QFont:
+    """
+    Get a default-family font of the given size, creating it only the first time.
+
+    Args:
+        pixel_size: Size in pixels (takes precedence over point_size)
+        point_size: Size in points
+        bold: Bold weight
+
+    Returns:
+        Shared QFont (callers must not modify it)
+    """
+    key = (pixel_size, point_size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = QFont()
+        if pixel_size:
+            font.setPixelSize(pixel_size)
+        elif point_size:
+            font.setPointSize(point_size)
+        font.setBold(bold)
+        _fonts[key] = font
+    return font
+
+
+# Emoji rendered once into icons, keyed by (emoji, size)
+_emoji_icons = {}
+
+
+def emoji_icon(emoji: str, size: int = 14) -> QIcon:
+    """
+    Get an icon showing an emoji, rendering it only the first time.
+
+    Emoji in widget text go through font fallback and shaping on every
+    paint; as an icon the glyph is drawn once.
+
+    Args:
+        emoji: Emoji character(s)
+        size: Icon size in logical pixels
+
+    Returns:
+        Cached QIcon
+    """
+    icon = _emoji_icons.get((emoji, size))
+    if icon is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(int(size * ratio), int(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(cached_font(pixel_size=size - 2))
+        painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, emoji)
+        painter.end()
+        icon = QIcon(pixmap)
+        _emoji_icons[(emoji, size)] = icon
+    return icon
+
+
+def compat_badge_value(gamepad_compat: str) -> str:
+    """
+    Map a gamepad compatibility text to its compatBadge style.
+
+    Args:
+        gamepad_compat: Compatibility text from the DB
+
+    Returns:
+        'works', 'partial', 'unknown' or 'broken'
+    """
+    gamepad_lower = gamepad_compat.lower()
+    if 'works' in gamepad_lower and 'doesn\'t' not in gamepad_lower:
+        return 'works'
+    if 'classic' in gamepad_lower or 'lr' in gamepad_lower:
+        return 'partial'
+    if 'unknown' in gamepad_lower:
+        return 'unknown'
+    return 'broken'
+
+
 def show_message(parent, msg_type, title, text, min_width=550):
     """Show message box without help button and with minimum width."""
     msg_box = QMessageBox(parent)
@@ -43,6 +316,125 @@ def show_message(parent, msg_type, title, text, min_width=550):
     msg_box.exec_()
 
 
+# Per-thread HTTP session (see http_session)
+_http_local = threading.local()
+
+
+def http_session():
+    """
+    Get this thread's requests.Session for image and title downloads.
+
+    Requests made through one session reuse its open connections, so the
+    several requests a job sends to GameTDB or GitHub skip the TCP and TLS
+    handshakes after the first. Sessions aren't shared between threads.
+
+    Returns:
+        requests.Session
+    """
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        import requests  # Deferred: only needed once images are downloaded
+        import urllib3
+        # Certificates aren't verified for these downloads (as before); don't warn per request
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        session = requests.Session()
+        session.verify = False
+        session.headers['User-Agent'] = 'Meta-Injector/1.0'
+        _http_local.session = session
+    return session
+
+
+def download_to_file(session, url: str, path: Path, timeout: int = 5) -> int:
+    """
+    Download a URL straight into a file, 64 KiB at a time.
+
+    The body is never held in memory as a whole.
+
+    Args:
+        session: requests.Session to use (see http_session)
+        url: URL to download
+        path: Destination file
+        timeout: Connect/read timeout in seconds
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        requests.RequestException: On a connection error or an HTTP error status
+    """
+    # Written under a temporary name so an interrupted download never
+    # leaves a truncated image that would later pass as cached
+    part_path = path.with_name(path.name + ".part")
+    with session.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        written = 0
+        try:
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_content(64 * 1024):
+                    written += f.write(chunk)
+            os.replace(part_path, path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+    return written
+
+
+# HEAD probes and paired downloads for images; shared by all icon downloads
+# so that parallel jobs don't multiply the number of open connections
+_HTTP_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="http")
+
+
+def _url_exists(url: str) -> bool:
+    """HEAD one URL; only a not-found answer or no answer at all counts as missing."""
+    try:
+        response = http_session().head(url, timeout=5, allow_redirects=True)
+    except Exception:
+        return False
+    # Anything but 404/410 (e.g. HEAD not allowed): let the real download decide
+    return response.status_code not in (404, 410)
+
+
+def fetch_to_file(url, path):
+    """Download url to path using the calling thread's session.
+
+    Args:
+        url: Image URL
+        path: Destination file path
+
+    Returns:
+        Number of bytes written
+    """
+    return download_to_file(http_session(), url, path)
+
+
+def iter_existing_urls(urls: list):
+    """
+    Yield the indexes of URLs worth downloading, in priority order.
+
+    The first URL is yielded without a probe, so the common case where it
+    exists costs no extra request. The rest are then HEAD-probed together;
+    each hit is yielded as soon as every URL before it has answered, and
+    probes still queued are cancelled once the caller stops iterating.
+
+    Args:
+        urls: Candidate URLs, best first
+
+    Yields:
+        Index into urls of the next candidate to try
+    """
+    if not urls:
+        return
+    yield 0
+    futures = [_HTTP_POOL.submit(_url_exists, url) for url in urls[1:]]
+    try:
+        for index, future in enumerate(futures, 1):
+            if future.result():
+                yield index
+    finally:
+        for future in futures:
+            future.cancel()
+
+
 class GameLoaderThread(QThread):
     """Background thread for loading game files with parallel downloads."""
 
@@ -69,44 +461,46 @@ class GameLoaderThread(QThread):
             loaded_count = 0
             total = len(self.file_paths)
 
-            # First pass: Extract game info (fast, sequential)
-            jobs_to_process = []
-            for idx, file_path in enumerate(self.file_paths):
-                if self.should_stop:
-                    break
-
-                try:
-                    game_path = Path(file_path)
-                    game_info = game_info_extractor.extract_game_info(game_path)
-
-                    if not game_info:
-                        print(f"[WARN] Failed to extract info from {game_path.name}")
-                        continue
-
-                    job = BatchBuildJob(game_path, game_info)
-                    self.prepare_job_metadata(job)
-                    jobs_to_process.append((idx, job))
-
-                except Exception as e:
-                    print(f"[ERROR] Failed to load {file_path}: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-            # Second pass: Download icons in parallel (multiple games at once)
-            if self.auto_download_icons and jobs_to_process:
-                with ThreadPoolExecutor(max_workers=8) as executor:
-                    # Submit all download jobs
-                    future_to_job = {}
-                    for idx, job in jobs_to_process:
-                        if self.should_stop:
-                            break
-                        future = executor.submit(self.download_icon_for_job, job)
-                        future_to_job[future] = (idx, job)
+            # Game info is extracted sequentially; with auto download on, each
+            # job's icon download starts as soon as its info is ready, so the
+            # downloads overlap the remaining header reads. Worker threads are
+            # only started once something is submitted.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                jobs_to_process = []
+                future_to_job = {}
+                for idx, file_path in enumerate(self.file_paths):
+                    if self.should_stop:
+                        break
 
+                    try:
+                        game_path = Path(file_path)
+                        game_info = game_info_extractor.extract_game_info(game_path)
+
+                        if not game_info:
+                            print(f"[WARN] Failed to extract info from {game_path.name}")
+                            continue
+
+                        job = BatchBuildJob(game_path, game_info)
+                        self.prepare_job_metadata(job)
+                        jobs_to_process.append((idx, job))
+                        if self.auto_download_icons:
+                            future = executor.submit(self.download_icon_for_job, job)
+                            future_to_job[future] = (idx, job)
+
+                    except Exception as e:
+                        print(f"[ERROR] Failed to load {file_path}: {e}")
+                        import traceback
+                        traceback.print_exc()
+
+                if self.auto_download_icons:
                     # Process completed downloads as they finish
                     completed = 0
                     for future in as_completed(future_to_job):
                         if self.should_stop:
+                            # Drop queued downloads so leaving the executor
+                            # only waits for the ones already running
+                            for pending in future_to_job:
+                                pending.cancel()
                             break
 
                         idx, job = future_to_job[future]
@@ -120,14 +514,14 @@ class GameLoaderThread(QThread):
                         self.progress_updated.emit(completed, len(jobs_to_process))
                         self.game_loaded.emit(job)
                         loaded_count += 1
-            else:
-                # No icon download, just emit jobs
-                for idx, job in jobs_to_process:
-                    if self.should_stop:
-                        break
-                    self.progress_updated.emit(idx + 1, total)
-                    self.game_loaded.emit(job)
-                    loaded_count += 1
+                else:
+                    # No icon download, just emit jobs
+                    for idx, job in jobs_to_process:
+                        if self.should_stop:
+                            break
+                        self.progress_updated.emit(idx + 1, total)
+                        self.game_loaded.emit(job)
+                        loaded_count += 1
 
             self.loading_finished.emit(loaded_count)
 
@@ -145,19 +539,16 @@ class GameLoaderThread(QThread):
         game_title = game_info.get('title', '')
 
         # Get region
-        region_map = {'P': 'EUR', 'E': 'USA', 'J': 'JAP', 'K': 'KOR'}
         region_code = game_id[3] if len(game_id) >= 4 else 'E'
-        region = region_map.get(region_code, 'USA')
+        region = REGION_BY_CODE.get(region_code, 'USA')
 
         # Search in compatibility DB
         found_game = None
         if game_id:
-            found_game = compatibility_db.get_game_by_id(game_id)
+            found_game = get_compatibility_db().get_game_by_id(game_id)
 
         if not found_game and game_title:
-            games = compatibility_db.search_games(game_title, region)
-            if games:
-                found_game = games[0]
+            found_game = get_compatibility_db().find_game_by_title(game_title, region)
 
         # Set title name - read both Korean and English titles from DB
         if found_game:
@@ -203,23 +594,14 @@ class GameLoaderThread(QThread):
             job.gamepad_compatibility = 'Unknown'
             job.host_game = ''
 
-        # Generate title ID
-        game_id_4char = game_id[:4] if len(game_id) >= 4 else game_id
-        title_id_hex = game_id_4char.encode('ascii').hex().upper()
-
-        system_type = game_info.get('system', 'wii')
-        if system_type == 'gc':
-            job.title_id = f"00050002{title_id_hex}"
-        else:
-            job.title_id = f"00050000{title_id_hex}"
+        # Generate title ID: system prefix + first 4 ID chars as ASCII hex
+        prefix = TITLE_ID_PREFIXES.get(game_info.get('system'), TITLE_ID_PREFIXES['wii'])
+        job.title_id = prefix + game_id[:4].encode('ascii').hex().upper()
 
         # WiiLink24 support check removed - requires NAND files to work anyway
 
     def download_icon_for_job(self, job: BatchBuildJob):
         """Download icon and banner for a job from local or remote repository."""
-        import urllib.request
-        import urllib.error
-        import ssl
         from .game_tdb import GameTdb
         from .resources import resources
         import shutil
@@ -233,10 +615,8 @@ class GameLoaderThread(QThread):
         full_id = game_id[:6] if len(game_id) >= 6 else game_id
         system_type = job.game_info.get('system', 'wii')
 
-        # Create SSL context early (needed for GameTDB title fetch)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        # Reused for every request of this job, including the GameTDB title fetch
+        session = http_session()
 
         # Use permanent cache directory (not temp - survives across builds)
         cache_dir = paths.images_cache / game_id
@@ -290,7 +670,7 @@ class GameLoaderThread(QThread):
             # If either title is missing, fetch from GameTDB
             if not ko_title or not en_title:
                 print(f"  [FETCH] Missing titles (KO={bool(ko_title)}, EN={bool(en_title)}), fetching from GameTDB...")
-                self.fetch_gametdb_title(job, game_id, ssl_context)
+                self.fetch_gametdb_title(job, game_id)
                 # Update from fetched data
                 if not ko_title:
                     ko_title = getattr(job, 'korean_title', None)
@@ -317,7 +697,7 @@ class GameLoaderThread(QThread):
                 if en_title:
                     (cache_dir / "title_en.txt").write_text(en_title, encoding='utf-8')
                 if ko_title or en_title:
-                    compatibility_db.update_titles(game_id, korean_title=ko_title, english_title=en_title)
+                    get_compatibility_db().update_titles(game_id, korean_title=ko_title, english_title=en_title)
             except:
                 pass
 
@@ -345,7 +725,7 @@ class GameLoaderThread(QThread):
 
                 # Fetch title from GameTDB only if not already in DB
                 if not (hasattr(job, 'has_korean_title') and job.has_korean_title):
-                    self.fetch_gametdb_title(job, game_id, ssl_context)
+                    self.fetch_gametdb_title(job, game_id)
 
                     # Save titles to cache and DB
                     try:
@@ -358,7 +738,7 @@ class GameLoaderThread(QThread):
                             (cache_dir / "title_en.txt").write_text(en_title, encoding='utf-8')
 
                         # Update DB with both titles
-                        compatibility_db.update_titles(game_id, korean_title=ko_title, english_title=en_title)
+                        get_compatibility_db().update_titles(game_id, korean_title=ko_title, english_title=en_title)
                     except:
                         pass
 
@@ -387,151 +767,142 @@ class GameLoaderThread(QThread):
         else:  # E or others
             region_codes = ['US', 'EN', 'JA', 'KO']
 
+        # Every attempt below needs the front cover. Try the best candidate
+        # straight away and only probe the others if it's missing
+        candidates = [(try_id, region) for try_id in alternative_ids for region in region_codes]
+        cover_urls = [f"https://art.gametdb.com/wii/cover/{region}/{try_id}.png" for try_id, region in candidates]
+
         # Try in priority order (region priority maintained)
-        for try_id in alternative_ids:
-            for region in region_codes:
-                # Full cover for banner (front+back+spine)
-                fullcover_url = f"https://art.gametdb.com/wii/coverfullHQ/{region}/{try_id}.png"
-                # Regular cover for icon (just front)
-                cover_url = f"https://art.gametdb.com/wii/cover/{region}/{try_id}.png"
+        for index in iter_existing_urls(cover_urls):
+            try_id, region = candidates[index]
+
+            # Full cover for banner (front+back+spine)
+            fullcover_url = f"https://art.gametdb.com/wii/coverfullHQ/{region}/{try_id}.png"
+            # Regular cover for icon (just front)
+            cover_url = cover_urls[index]
+
+            try:
+                # Download full cover for banner and DRC
+                response = session.get(fullcover_url, timeout=5)
+                response.raise_for_status()
+                banner_data = response.content
+
+                # Resize for banner (1280x720)
+                img = Image.open(io.BytesIO(banner_data))
+                banner_img = img.resize((1280, 720), Image.Resampling.LANCZOS)
+                banner_path = cache_dir / "banner.png"
+                banner_img.save(banner_path)
+                job.banner_path = banner_path
+
+                # Resize for DRC (854x480)
+                drc_img = img.resize((854, 480), Image.Resampling.LANCZOS)
+                drc_path = cache_dir / "drc.png"
+                drc_img.save(drc_path)
+                job.drc_path = drc_path
+
+                # Download cover and crop top portion for icon
+                response = session.get(cover_url, timeout=5)
+                response.raise_for_status()
+                cover_data = response.content
 
+                # Crop top portion of cover for icon
+                img = Image.open(io.BytesIO(cover_data))
+                width, height = img.size
+
+                # Crop top square portion (width x width from top)
+                crop_size = min(width, height)
+                cropped = img.crop((0, 0, width, crop_size))
+
+                # Resize to icon size (128x128)
+                icon_img = cropped.resize((128, 128), Image.Resampling.LANCZOS)
+
+                icon_path = cache_dir / "icon.png"
+                icon_img.save(icon_path)
+                job.icon_path = icon_path
+
+                print(f"  [OK] Downloaded from GameTDB for {try_id} ({region})")
+                download_success = True
+
+                # Try to get Korean title from GameTDB
+                self.fetch_gametdb_title(job, try_id)
+                return True
+
+            except Exception as e:
+                # Try just cover if fullcover fails
                 try:
-                    # Download full cover for banner and DRC
-                    req = urllib.request.Request(
-                        fullcover_url,
-                        headers={'User-Agent': 'Meta-Injector/1.0'}
-                    )
-                    with urllib.request.urlopen(req, context=ssl_context, timeout=5) as response:
-                        banner_data = response.read()
-
-                        # Resize for banner (1280x720)
-                        img = Image.open(io.BytesIO(banner_data))
-                        banner_img = img.resize((1280, 720), Image.Resampling.LANCZOS)
-                        banner_path = cache_dir / "banner.png"
-                        banner_img.save(banner_path)
-                        job.banner_path = banner_path
-
-                        # Resize for DRC (854x480)
-                        drc_img = img.resize((854, 480), Image.Resampling.LANCZOS)
-                        drc_path = cache_dir / "drc.png"
-                        drc_img.save(drc_path)
-                        job.drc_path = drc_path
-
-                    # Download cover and crop top portion for icon
-                    req = urllib.request.Request(
-                        cover_url,
-                        headers={'User-Agent': 'Meta-Injector/1.0'}
-                    )
-                    with urllib.request.urlopen(req, context=ssl_context, timeout=5) as response:
-                        cover_data = response.read()
-
-                        # Crop top portion of cover for icon
-                        img = Image.open(io.BytesIO(cover_data))
-                        width, height = img.size
-
-                        # Crop top square portion (width x width from top)
-                        crop_size = min(width, height)
-                        cropped = img.crop((0, 0, width, crop_size))
-
-                        # Resize to icon size (128x128)
-                        icon_img = cropped.resize((128, 128), Image.Resampling.LANCZOS)
-
-                        icon_path = cache_dir / "icon.png"
-                        icon_img.save(icon_path)
-                        job.icon_path = icon_path
-
-                    print(f"  [OK] Downloaded from GameTDB for {try_id} ({region})")
+                    response = session.get(cover_url, timeout=5)
+                    response.raise_for_status()
+                    cover_data = response.content
+
+                    # Use cover for both
+                    img = Image.open(io.BytesIO(cover_data))
+                    width, height = img.size
+
+                    # Crop top for icon
+                    crop_size = min(width, height)
+                    cropped = img.crop((0, 0, width, crop_size))
+                    icon_img = cropped.resize((128, 128), Image.Resampling.LANCZOS)
+                    icon_path = cache_dir / "icon.png"
+                    icon_img.save(icon_path)
+                    job.icon_path = icon_path
+
+                    # Resize for banner (1280x720)
+                    banner_img = img.resize((1280, 720), Image.Resampling.LANCZOS)
+                    banner_path = cache_dir / "banner.png"
+                    banner_img.save(banner_path)
+                    job.banner_path = banner_path
+
+                    # Resize for DRC (854x480)
+                    drc_img = img.resize((854, 480), Image.Resampling.LANCZOS)
+                    drc_path = cache_dir / "drc.png"
+                    drc_img.save(drc_path)
+                    job.drc_path = drc_path
+
+                    print(f"  [OK] Downloaded cover from GameTDB for {try_id} ({region})")
                     download_success = True
 
                     # Try to get Korean title from GameTDB
-                    self.fetch_gametdb_title(job, try_id, ssl_context)
+                    self.fetch_gametdb_title(job, try_id)
                     return True
-
-                except Exception as e:
-                    # Try just cover if fullcover fails
-                    try:
-                        req = urllib.request.Request(
-                            cover_url,
-                            headers={'User-Agent': 'Meta-Injector/1.0'}
-                        )
-                        with urllib.request.urlopen(req, context=ssl_context, timeout=5) as response:
-                            cover_data = response.read()
-
-                            # Use cover for both
-                            img = Image.open(io.BytesIO(cover_data))
-                            width, height = img.size
-
-                            # Crop top for icon
-                            crop_size = min(width, height)
-                            cropped = img.crop((0, 0, width, crop_size))
-                            icon_img = cropped.resize((128, 128), Image.Resampling.LANCZOS)
-                            icon_path = cache_dir / "icon.png"
-                            icon_img.save(icon_path)
-                            job.icon_path = icon_path
-
-                            # Resize for banner (1280x720)
-                            banner_img = img.resize((1280, 720), Image.Resampling.LANCZOS)
-                            banner_path = cache_dir / "banner.png"
-                            banner_img.save(banner_path)
-                            job.banner_path = banner_path
-
-                            # Resize for DRC (854x480)
-                            drc_img = img.resize((854, 480), Image.Resampling.LANCZOS)
-                            drc_path = cache_dir / "drc.png"
-                            drc_img.save(drc_path)
-                            job.drc_path = drc_path
-
-                            print(f"  [OK] Downloaded cover from GameTDB for {try_id} ({region})")
-                            download_success = True
-
-                            # Try to get Korean title from GameTDB
-                            self.fetch_gametdb_title(job, try_id, ssl_context)
-                            return True
-                    except:
-                        continue
+                except:
+                    continue
 
         # Fallback to UWUVCI-IMAGES
         if not download_success:
-            for try_id in alternative_ids:
-                icon_url = f"https://raw.githubusercontent.com/UWUVCI-PRIME/UWUVCI-IMAGES/master/{system_type}/{try_id}/iconTex.png"
-                banner_url = f"https://raw.githubusercontent.com/UWUVCI-PRIME/UWUVCI-IMAGES/master/{system_type}/{try_id}/bootTvTex.png"
+            repo_url = f"https://raw.githubusercontent.com/UWUVCI-PRIME/UWUVCI-IMAGES/master/{system_type}"
+            icon_urls = [f"{repo_url}/{try_id}/iconTex.png" for try_id in alternative_ids]
+            for index in iter_existing_urls(icon_urls):
+                try_id = alternative_ids[index]
+                icon_url = icon_urls[index]
+                banner_url = f"{repo_url}/{try_id}/bootTvTex.png"
 
                 try:
-                    # Download icon
-                    req = urllib.request.Request(
-                        icon_url,
-                        headers={'User-Agent': 'Meta-Injector/1.0'}
-                    )
-                    with urllib.request.urlopen(req, context=ssl_context, timeout=5) as response:
-                        icon_data = response.read()
-                        icon_path = cache_dir / "icon.png"
-                        icon_path.write_bytes(icon_data)
-                        job.icon_path = icon_path
-
-                    # Download banner
-                    req = urllib.request.Request(
-                        banner_url,
-                        headers={'User-Agent': 'Meta-Injector/1.0'}
-                    )
-                    with urllib.request.urlopen(req, context=ssl_context, timeout=5) as response:
-                        banner_data = response.read()
-                        banner_path = cache_dir / "banner.png"
-                        banner_path.write_bytes(banner_data)
-                        job.banner_path = banner_path
-
-                        # Resize banner for DRC (854x480)
-                        banner_img = Image.open(io.BytesIO(banner_data))
-                        drc_img = banner_img.resize((854, 480), Image.Resampling.LANCZOS)
-                        drc_path = cache_dir / "drc.png"
-                        drc_img.save(drc_path)
-                        job.drc_path = drc_path
+                    # Download icon and banner side by side (each pool
+                    # thread uses its own session)
+                    icon_path = cache_dir / "icon.png"
+                    banner_path = cache_dir / "banner.png"
+                    icon_future = _HTTP_POOL.submit(fetch_to_file, icon_url, icon_path)
+                    banner_future = _HTTP_POOL.submit(fetch_to_file, banner_url, banner_path)
+                    # Wait for both before raising, so a failed pair leaves no download running
+                    wait([icon_future, banner_future])
+                    icon_future.result()
+                    job.icon_path = icon_path
+                    banner_future.result()
+                    job.banner_path = banner_path
+
+                    # Resize banner for DRC (854x480)
+                    banner_img = Image.open(banner_path)
+                    drc_img = banner_img.resize((854, 480), Image.Resampling.LANCZOS)
+                    drc_path = cache_dir / "drc.png"
+                    drc_img.save(drc_path)
+                    job.drc_path = drc_path
 
                     print(f"  [OK] Downloaded from UWUVCI for {try_id}")
                     download_success = True
 
                     # Try to get title from GameTDB only if not already in DB
                     if not (hasattr(job, 'has_korean_title') and job.has_korean_title):
-                        self.fetch_gametdb_title(job, try_id, ssl_context)
+                        self.fetch_gametdb_title(job, try_id)
 
                         # Save titles to cache and DB
                         try:
@@ -544,7 +915,7 @@ class GameLoaderThread(QThread):
                                 (cache_dir / "title_en.txt").write_text(en_title, encoding='utf-8')
 
                             # Update DB with both titles
-                            compatibility_db.update_titles(try_id, korean_title=ko_title, english_title=en_title)
+                            get_compatibility_db().update_titles(try_id, korean_title=ko_title, english_title=en_title)
                         except:
                             pass
 
@@ -592,12 +963,13 @@ class GameLoaderThread(QThread):
         # Images are already saved to cache_dir during download, no need to copy again
         return True
 
-    def fetch_gametdb_title(self, job: BatchBuildJob, game_id: str, ssl_context):
+    def fetch_gametdb_title(self, job: BatchBuildJob, game_id: str):
         """Fetch Korean title from GameTDB. Falls back to DB title if not found."""
-        import urllib.request
         import re
         import time
 
+        session = http_session()
+
         max_retries = 1
         for attempt in range(max_retries):
             try:
@@ -607,47 +979,44 @@ class GameLoaderThread(QThread):
 
                 # GameTDB game page
                 url = f"https://www.gametdb.com/Wii/{game_id}"
-                req = urllib.request.Request(
-                    url,
-                    headers={'User-Agent': 'WiiVC-Injector/1.0'}
-                )
-                with urllib.request.urlopen(req, context=ssl_context, timeout=5) as response:
-                    html = response.read().decode('utf-8', errors='ignore')
+                response = session.get(url, headers={'User-Agent': 'WiiVC-Injector/1.0'}, timeout=5)
+                response.raise_for_status()
+                html = response.content.decode('utf-8', errors='ignore')
 
-                    # Extract both Korean and English titles
-                    ko_title = None
-                    en_title = None
+                # Extract both Korean and English titles
+                ko_title = None
+                en_title = None
 
-                    # Look for Korean title - pattern: title (KO)</td><td...>쿠킹 마마</td>
-                    ko_match = re.search(r'title\s*\(KO\)</td><td[^>]*>([^<]+)</td>', html)
-                    if ko_match:
-                        ko_title = ko_match.group(1).strip()
+                # Look for Korean title - pattern: title (KO)</td><td...>쿠킹 마마</td>
+                ko_match = re.search(r'title\s*\(KO\)</td><td[^>]*>([^<]+)</td>', html)
+                if ko_match:
+                    ko_title = ko_match.group(1).strip()
 
-                    # Look for EN title - pattern: title (EN)</td><td...>Cooking Mama</td>
-                    en_match = re.search(r'title\s*\(EN\)</td><td[^>]*>([^<]+)</td>', html)
-                    if en_match:
-                        en_title = en_match.group(1).strip()
+                # Look for EN title - pattern: title (EN)</td><td...>Cooking Mama</td>
+                en_match = re.search(r'title\s*\(EN\)</td><td[^>]*>([^<]+)</td>', html)
+                if en_match:
+                    en_title = en_match.group(1).strip()
 
-                    # Store both titles in job
-                    if ko_title:
-                        job.korean_title = ko_title
-                        print(f"  [TITLE] GameTDB Korean: {ko_title}")
-                    if en_title:
-                        job.english_title = en_title
-                        print(f"  [TITLE] GameTDB English: {en_title}")
-
-                    # Set display title based on current language
-                    if tr.current_language == "ko" and ko_title:
-                        job.title_name = ko_title
-                    elif en_title:
-                        job.title_name = en_title
-                    elif ko_title:
-                        job.title_name = ko_title
-                    else:
-                        # No title found on GameTDB, keep DB title
-                        print(f"  [TITLE] No GameTDB title, using DB: {job.title_name}")
+                # Store both titles in job
+                if ko_title:
+                    job.korean_title = ko_title
+                    print(f"  [TITLE] GameTDB Korean: {ko_title}")
+                if en_title:
+                    job.english_title = en_title
+                    print(f"  [TITLE] GameTDB English: {en_title}")
+
+                # Set display title based on current language
+                if tr.current_language == "ko" and ko_title:
+                    job.title_name = ko_title
+                elif en_title:
+                    job.title_name = en_title
+                elif ko_title:
+                    job.title_name = ko_title
+                else:
+                    # No title found on GameTDB, keep DB title
+                    print(f"  [TITLE] No GameTDB title, using DB: {job.title_name}")
 
-                    return
+                return
 
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -660,13 +1029,138 @@ class GameLoaderThread(QThread):
                     return
 
 
+class CompatDbUpdateSignals(QObject):
+    """Signals for CompatDbUpdateTask (QRunnable can't emit by itself)."""
+
+    update_finished = pyqtSignal(int, str)  # returncode, error output
+
+
+class CompatDbUpdateTask(QRunnable):
+    """Run the compatibility DB import script on the global thread pool."""
+
+    def __init__(self, script_path: Path):
+        super().__init__()
+        self.script_path = script_path
+        self.signals = CompatDbUpdateSignals()
+
+    def run(self):
+        """Run the import script and report its result."""
+        import subprocess
+        import sys
+
+        try:
+            result = subprocess.run(
+                [sys.executable, str(self.script_path)],
+                capture_output=True,
+                text=True,
+                encoding='utf-8'
+            )
+            self.signals.update_finished.emit(result.returncode, result.stderr if result.stderr else result.stdout)
+        except Exception as e:
+            self.signals.update_finished.emit(-1, str(e))
+
+
+def load_scaled_image(path, width: int, height: int) -> QImage:
+    """Load an image already scaled to fit width x height (aspect kept).
+
+    The reader decodes straight to the target size where the format
+    allows it (JPEG), instead of decoding full size and scaling after.
+    This is for previews only: low quality picks the fast scaler, and
+    EXIF rotation is skipped, as it is when the build processes the image.
+    Returns a null QImage if the file can't be read.
+    """
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(False)
+    reader.setQuality(25)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(width, height, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def pixmap_cache_key(path, width: int, height: int) -> str:
+    """QPixmapCache key for path scaled to width x height; changes with the file's mtime."""
+    return f"{path}|{os.stat(path).st_mtime_ns}|{width}x{height}"
+
+
+def find_cached_pixmap(key: str) -> Optional[QPixmap]:
+    """Look up a pixmap in QPixmapCache, None on a miss."""
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        return None
+    return pixmap
+
+
+def load_scaled_pixmap(path, width: int, height: int) -> QPixmap:
+    """load_scaled_image() as a QPixmap, served from QPixmapCache when possible.
+
+    Returns a null QPixmap if the file can't be read.
+    """
+    key = pixmap_cache_key(path, width, height)
+    pixmap = find_cached_pixmap(key)
+    if pixmap is None:
+        pixmap = QPixmap.fromImage(load_scaled_image(path, width, height))
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class ImageDecodeSignals(QObject):
+    """Signals for ImageDecodeTask (QRunnable can't emit by itself)."""
+
+    decoded = pyqtSignal(object, str, str, QImage)  # job, kind, cache key, image
+
+
+class ImageDecodeTask(QRunnable):
+    """Decode and scale a preview image on the global thread pool.
+
+    Only QImage is safe off the GUI thread; the receiver turns the result
+    into a QPixmap.
+    """
+
+    def __init__(self, job, kind: str, key: str, path: Path, width: int, height: int):
+        super().__init__()
+        self.job = job
+        self.kind = kind
+        self.key = key
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = ImageDecodeSignals()
+
+    def run(self):
+        image = load_scaled_image(self.path, self.width, self.height)
+        self.signals.decoded.emit(self.job, self.kind, self.key, image)
+
+
+class ToolProvisionTask(QRunnable):
+    """Copy the core tools into TOOLDIR in the background after startup."""
+
+    def run(self):
+        try:
+            paths.create_temp_directories()
+            BuildEngine(paths).provision_tools()
+        except Exception as e:
+            # The build provisions again and reports errors itself
+            print(f"[SETUP] Background tool copy failed: {e}")
+
+
 class SimpleKeysDialog(QDialog):
     """Simple dialog for entering encryption keys."""
 
+    # Key inputs in form order: (settings key, display name, required)
+    KEY_FIELDS = (
+        ('wii_u_common_key', "Wii U Common Key", True),
+        ('title_key_rhythm_heaven', "Rhythm Heaven Fever", True),
+        ('title_key_xenoblade', "Xenoblade Chronicles", False),
+        ('title_key_galaxy2', "Mario Galaxy 2", False),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Remove ? button from title bar
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.db_update_task = None
         self.init_ui()
         self.load_existing_settings()
 
@@ -693,28 +1187,25 @@ class SimpleKeysDialog(QDialog):
         # Form layout for aligned inputs
         form = QFormLayout()
 
-        # Common Key (Required - highlighted)
-        self.common_key_input = QLineEdit()
-        self.common_key_input.setPlaceholderText(tr.get("common_key_placeholder"))
-        self.common_key_input.setStyleSheet("QLineEdit { background-color: #fff8dc; border: 2px solid #ff6b6b; }")
-        self.common_key_input.textChanged.connect(self.update_common_key_style)
-        form.addRow("Wii U Common Key:", self.common_key_input)
-
-        # Title Keys
-        # Rhythm Heaven Fever (Required - highlighted)
-        self.rhythm_key_input = QLineEdit()
-        self.rhythm_key_input.setPlaceholderText("필수 - Rhythm Heaven Fever (USA)")
-        self.rhythm_key_input.setStyleSheet("QLineEdit { background-color: #fff8dc; border: 2px solid #ff6b6b; }")
-        self.rhythm_key_input.textChanged.connect(self.update_rhythm_key_style)
-        form.addRow("Rhythm Heaven Fever:", self.rhythm_key_input)
-
-        self.xenoblade_key_input = QLineEdit()
-        self.xenoblade_key_input.setPlaceholderText("선택 - Xenoblade Chronicles (USA)")
-        form.addRow("Xenoblade Chronicles:", self.xenoblade_key_input)
-
-        self.galaxy_key_input = QLineEdit()
-        self.galaxy_key_input.setPlaceholderText("선택 - Super Mario Galaxy 2 (EUR)")
-        form.addRow("Mario Galaxy 2:", self.galaxy_key_input)
+        # Common key and title keys; required ones are highlighted until filled
+        placeholders = {
+            'wii_u_common_key': tr.get("common_key_placeholder"),
+            'title_key_rhythm_heaven': "필수 - Rhythm Heaven Fever (USA)",
+            'title_key_xenoblade': "선택 - Xenoblade Chronicles (USA)",
+            'title_key_galaxy2': "선택 - Super Mario Galaxy 2 (EUR)",
+        }
+        self.key_inputs = {}
+        for settings_key, display_name, required in self.KEY_FIELDS:
+            line_edit = QLineEdit()
+            line_edit.setPlaceholderText(placeholders[settings_key])
+            if required:
+                line_edit.setObjectName("requiredKey")
+                self._update_required_field_style(line_edit)
+                line_edit.textChanged.connect(
+                    lambda _text, edit=line_edit: self._update_required_field_style(edit)
+                )
+            form.addRow(f"{display_name}:", line_edit)
+            self.key_inputs[settings_key] = line_edit
 
         # Output directory (in FormLayout with buttons)
         output_widget = QWidget()
@@ -766,44 +1257,11 @@ class SimpleKeysDialog(QDialog):
 
         save_btn = QPushButton(tr.get("save"))
         save_btn.clicked.connect(self.save)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5cb85c, stop:1 #4cae4c);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 16px;
-                border: 1px solid #3d8b3d;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #6cc76c, stop:1 #5cb85c);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a9d4a, stop:1 #3d8b3d);
-            }
-        """)
+        save_btn.setObjectName("dialogSaveButton")
 
         cancel_btn = QPushButton(tr.get("cancel"))
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff6b6b, stop:1 #ee5555);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 16px;
-                border: 1px solid #dd4444;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff5555, stop:1 #ee3333);
-                border-color: #cc2222;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ee3333, stop:1 #dd2222);
-            }
-        """)
+        cancel_btn.setObjectName("dialogCancelButton")
         btn_layout.addWidget(save_btn)
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
@@ -812,23 +1270,14 @@ class SimpleKeysDialog(QDialog):
         """
         Generic method to update the style of a required QLineEdit based on content.
         """
-        if line_edit.text():
-            line_edit.setStyleSheet("QLineEdit { background-color: #e6ffe6; border: 2px solid #66bb66; }")
-        else:
-            line_edit.setStyleSheet("QLineEdit { background-color: #fff8dc; border: 2px solid #ff6b6b; }")
-
-    def update_common_key_style(self):
-        """Updates the style for the Wii U Common key input."""
-        self._update_required_field_style(self.common_key_input)
-
-    def update_rhythm_key_style(self):
-        """Updates the style for the Rhythm Heaven Fever key input."""
-        self._update_required_field_style(self.rhythm_key_input)
+        set_style_property(line_edit, "filled", "true" if line_edit.text() else "false")
 
     def browse_output_dir(self):
         """Browse for output directory."""
         dialog_title = tr.get("output_folder").replace(":", "")
-        output_dir = QFileDialog.getExistingDirectory(self, dialog_title)
+        output_dir = QFileDialog.getExistingDirectory(
+            self, dialog_title, "", QFileDialog.ShowDirsOnly | FILE_DIALOG_OPTIONS
+        )
         if output_dir:
             self.output_dir_input.setText(output_dir)
 
@@ -838,11 +1287,6 @@ class SimpleKeysDialog(QDialog):
 
     def update_compatibility_db(self):
         """Update compatibility database from UWUVCI repository."""
-        from PyQt5.QtCore import QThread, pyqtSignal
-        import urllib.request
-        import json as json_lib
-        import time
-
         # Confirm with user
         if tr.current_language == "ko":
             msg = "UWUVCI-PRIME 리포지토리에서 최신 호환성 데이터를 다운로드합니다.\n\nGameTDB에서 게임 ID를 검색하므로 시간이 걸릴 수 있습니다.\n계속하시겠습니까?"
@@ -874,106 +1318,83 @@ class SimpleKeysDialog(QDialog):
         self.db_update_btn.setEnabled(False)
         self.db_update_btn.setText("업데이트 중..." if tr.current_language == "ko" else "Updating...")
 
-        # Import the update function
-        try:
-            # Run import script
-            import subprocess
-            import sys
-
-            script_path = Path(__file__).parent.parent / "import_uwuvci_compat.py"
-
-            # Create progress dialog
-            progress = QMessageBox(self)
-            progress.setWindowTitle(title)
-            progress.setText("다운로드 중..." if tr.current_language == "ko" else "Downloading...")
-            progress.setStandardButtons(QMessageBox.NoButton)
-            progress.setModal(True)
-            progress.show()
-
-            # Process events to show the dialog
-            from PyQt5.QtWidgets import QApplication
-            QApplication.processEvents()
-
-            # Run import script
-            result = subprocess.run(
-                [sys.executable, str(script_path)],
-                capture_output=True,
-                text=True,
-                encoding='utf-8'
-            )
-
-            progress.close()
-
-            # Re-enable button
-            self.db_update_btn.setEnabled(True)
-            db_update_text = "호환성 DB 업데이트" if tr.current_language == "ko" else "Update Compatibility DB"
-            self.db_update_btn.setText(db_update_text)
-
-            if result.returncode == 0:
-                # Success
-                if tr.current_language == "ko":
-                    success_msg = "호환성 DB가 성공적으로 업데이트되었습니다!"
-                else:
-                    success_msg = "Compatibility DB updated successfully!"
+        # Create progress dialog
+        self.db_update_progress = QMessageBox(self)
+        self.db_update_progress.setWindowTitle(title)
+        self.db_update_progress.setText("다운로드 중..." if tr.current_language == "ko" else "Downloading...")
+        self.db_update_progress.setStandardButtons(QMessageBox.NoButton)
+        self.db_update_progress.setModal(True)
+        self.db_update_progress.show()
+
+        # Run import script in background so the dialog keeps painting
+        script_path = Path(__file__).parent.parent / "import_uwuvci_compat.py"
+        # (the dialog is kept by BatchWindow, so it is still there to receive the result)
+        self.db_update_task = CompatDbUpdateTask(script_path)
+        self.db_update_task.signals.update_finished.connect(
+            lambda returncode, output: self.on_compatibility_db_updated(title, returncode, output))
+        QThreadPool.globalInstance().start(self.db_update_task)
+
+    def on_compatibility_db_updated(self, title, returncode, output):
+        """Handle import script completion."""
+        self.db_update_task = None
+        self.db_update_progress.close()
+
+        # Re-enable button
+        self.db_update_btn.setEnabled(True)
+        db_update_text = "호환성 DB 업데이트" if tr.current_language == "ko" else "Update Compatibility DB"
+        self.db_update_btn.setText(db_update_text)
 
-                show_message(self, "info", title, success_msg)
+        if returncode == 0:
+            # Success - the script wrote the DB behind our cached reads
+            get_compatibility_db().invalidate_cache()
+            if tr.current_language == "ko":
+                success_msg = "호환성 DB가 성공적으로 업데이트되었습니다!"
             else:
-                # Error
-                error_msg = result.stderr if result.stderr else result.stdout
-                if tr.current_language == "ko":
-                    fail_msg = f"업데이트 실패:\n\n{error_msg}"
-                else:
-                    fail_msg = f"Update failed:\n\n{error_msg}"
+                success_msg = "Compatibility DB updated successfully!"
 
-                show_message(self, "warning", title, fail_msg)
-
-        except Exception as e:
-            # Re-enable button
-            self.db_update_btn.setEnabled(True)
-            db_update_text = "호환성 DB 업데이트" if tr.current_language == "ko" else "Update Compatibility DB"
-            self.db_update_btn.setText(db_update_text)
+            show_message(self, "info", title, success_msg)
+        else:
+            # Error
+            if tr.current_language == "ko":
+                fail_msg = f"업데이트 실패:\n\n{output}"
+            else:
+                fail_msg = f"Update failed:\n\n{output}"
 
-            error_msg = f"업데이트 실패: {e}" if tr.current_language == "ko" else f"Update failed: {e}"
-            show_message(self, "warning", title, error_msg)
+            show_message(self, "warning", title, fail_msg)
 
     def save(self):
         """Save keys and close."""
-        import json
+        keys = {settings_key: line_edit.text().strip() for settings_key, line_edit in self.key_inputs.items()}
 
-        common_key = self.common_key_input.text().strip()
-        if not common_key:
+        if not keys['wii_u_common_key']:
             error_msg = "Wii U Common Key가 필요합니다!" if tr.current_language == "ko" else "Wii U Common Key is required!"
             show_message(self, "warning", tr.get("error"), error_msg)
             return
 
         # Check if at least Rhythm Heaven key is provided (required)
-        rhythm_key = self.rhythm_key_input.text().strip()
-        xenoblade_key = self.xenoblade_key_input.text().strip()
-        galaxy_key = self.galaxy_key_input.text().strip()
-
-        if not rhythm_key:
+        if not keys['title_key_rhythm_heaven']:
             error_msg = "Rhythm Heaven Fever 타이틀 키는 필수입니다!" if tr.current_language == "ko" else "Rhythm Heaven Fever title key is required!"
             show_message(self, "warning", tr.get("error"), error_msg)
             return
 
-        # Save to settings file
-        output_dir = self.output_dir_input.text().strip()
-        settings = {
-            'wii_u_common_key': common_key,
-            'title_key_rhythm_heaven': rhythm_key,
-            'title_key_xenoblade': xenoblade_key,
-            'title_key_galaxy2': galaxy_key,
-            'output_directory': output_dir
-        }
+        # Keys must be 32 hex digits (optional keys may be left empty)
+        from .utils import verify_key  # Deferred: utils pulls in urllib.request
+        for settings_key, key_name, _required in self.KEY_FIELDS:
+            key = keys[settings_key]
+            if key and not verify_key(key):
+                if tr.current_language == "ko":
+                    error_msg = f"{key_name} 키 형식이 올바르지 않습니다 (16진수 32자리)."
+                else:
+                    error_msg = f"{key_name} key is invalid (must be 32 hex digits)."
+                show_message(self, "warning", tr.get("error"), error_msg)
+                return
 
-        settings_file = Path.home() / ".meta_injector_settings.json"
-        print(f"[DEBUG] Saving settings to: {settings_file}")
-        print(f"[DEBUG] Settings: {settings}")
+        # Save to settings file
+        settings = dict(keys)
+        settings['output_directory'] = self.output_dir_input.text().strip()
 
         try:
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
-            print(f"[DEBUG] Settings saved successfully")
+            save_settings(settings)
         except Exception as e:
             print(f"[ERROR] Failed to save settings: {e}")
             import traceback
@@ -986,40 +1407,15 @@ class SimpleKeysDialog(QDialog):
 
     def load_existing_settings(self):
         """Load existing settings from file."""
-        import json
-
-        settings_file = Path.home() / ".meta_injector_settings.json"
-        if not settings_file.exists():
-            return
-
         try:
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-
-                # Fill in existing values and update styles
-                common_key = settings.get('wii_u_common_key', '')
-                if common_key:
-                    self.common_key_input.setText(common_key)
-                self.update_common_key_style()
-
-                rhythm_key = settings.get('title_key_rhythm_heaven', '')
-                if rhythm_key:
-                    self.rhythm_key_input.setText(rhythm_key)
-                self.update_rhythm_key_style()
-
-                xenoblade_key = settings.get('title_key_xenoblade', '')
-                if xenoblade_key:
-                    self.xenoblade_key_input.setText(xenoblade_key)
+            settings = load_settings()
 
-                galaxy_key = settings.get('title_key_galaxy2', '')
-                if galaxy_key:
-                    self.galaxy_key_input.setText(galaxy_key)
+            # Fill in stored values, clearing anything left from an earlier
+            # cancelled edit (required fields restyle on textChanged)
+            for settings_key, line_edit in self.key_inputs.items():
+                line_edit.setText(settings.get(settings_key, ''))
 
-                output_dir = settings.get('output_directory', '')
-                if output_dir:
-                    self.output_dir_input.setText(output_dir)
-
-                print("[DEBUG] Loaded existing settings into dialog")
+            self.output_dir_input.setText(settings.get('output_directory', ''))
         except Exception as e:
             print(f"[WARN] Failed to load existing settings: {e}")
 
@@ -1027,6 +1423,9 @@ class SimpleKeysDialog(QDialog):
 class EditGameDialog(QDialog):
     """Dialog to edit individual game metadata."""
 
+    # Preview label sizes, by kind
+    PREVIEW_SIZES = {"icon": (192, 192), "banner": (384, 216)}
+
     def __init__(self, job: BatchBuildJob, available_bases: dict = None, parent=None):
         super().__init__(parent)
         # Remove ? button from title bar
@@ -1052,7 +1451,7 @@ class EditGameDialog(QDialog):
         icon_layout.addWidget(QLabel(icon_label_text))
         self.icon_preview = QLabel()
         self.icon_preview.setFixedSize(192, 192)
-        self.icon_preview.setStyleSheet("border: 2px solid #ccc; background: #f0f0f0;")
+        self.icon_preview.setObjectName("imagePreview")
         self.icon_preview.setAlignment(Qt.AlignCenter)
         # Icon will be loaded after UI setup
         self.icon_preview.mousePressEvent = lambda e: self.change_icon()
@@ -1066,19 +1465,11 @@ class EditGameDialog(QDialog):
         banner_layout.addWidget(QLabel(banner_label_text))
         self.banner_preview = QLabel()
         self.banner_preview.setFixedSize(384, 216)
-        self.banner_preview.setStyleSheet("border: 2px solid #ccc; background: #f0f0f0;")
+        self.banner_preview.setObjectName("imagePreview")
         self.banner_preview.setAlignment(Qt.AlignCenter)
         if self.job.banner_path and self.job.banner_path.exists():
-            print(f"[DEBUG] Loading banner from: {self.job.banner_path}")
-            pixmap = QPixmap(str(self.job.banner_path))
-            if not pixmap.isNull():
-                self.banner_preview.setPixmap(pixmap.scaled(384, 216, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                print(f"[ERROR] Failed to load banner pixmap from: {self.job.banner_path}")
-                no_image_text = "이미지 로드 실패" if tr.current_language == "ko" else "Failed to load image"
-                self.banner_preview.setText(no_image_text)
+            self.decode_preview("banner", self.job.banner_path)
         else:
-            print(f"[DEBUG] Banner path not found or doesn't exist: {self.job.banner_path}")
             no_image_text = "이미지 없음\n클릭하여 선택" if tr.current_language == "ko" else "No Image\nClick to select"
             self.banner_preview.setText(no_image_text)
         self.banner_preview.mousePressEvent = lambda e: self.change_banner()
@@ -1102,7 +1493,7 @@ class EditGameDialog(QDialog):
         id_layout.addWidget(QLabel(title_id_text))
         self.id_input = QLineEdit(self.job.title_id)
         self.id_input.setReadOnly(True)  # Make read-only (can still copy text)
-        self.id_input.setStyleSheet("background-color: #f5f5f5;")  # Visual indicator
+        set_palette_color(self.id_input, QPalette.Base, "#f5f5f5")  # Visual indicator
         id_layout.addWidget(self.id_input)
         layout.addLayout(id_layout)
 
@@ -1133,45 +1524,12 @@ class EditGameDialog(QDialog):
 
         save_btn = QPushButton(tr.get("save"))
         save_btn.clicked.connect(self.save)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5cb85c, stop:1 #4cae4c);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 12px; /* Consistent padding */
-                border: 1px solid #3d8b3d;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #6cc76c, stop:1 #5cb85c);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a9d4a, stop:1 #3d8b3d);
-            }
-        """)
+        save_btn.setObjectName("dialogSaveButton")
         btn_layout.addWidget(save_btn)
 
         cancel_btn = QPushButton(tr.get("cancel"))
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff6b6b, stop:1 #ee5555);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 12px; /* Consistent padding */
-                border: 1px solid #dd4444;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff5555, stop:1 #ee3333);
-                border-color: #cc2222;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ee3333, stop:1 #dd2222);
-            }
-        """)
+        cancel_btn.setObjectName("dialogCancelButton")
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
 
@@ -1181,32 +1539,14 @@ class EditGameDialog(QDialog):
     def load_initial_icon(self):
         """Load initial icon with badge overlays if needed."""
         if self.job.icon_path and self.job.icon_path.exists():
-            print(f"[DEBUG] Loading icon from: {self.job.icon_path}")
-            pixmap = QPixmap(str(self.job.icon_path))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(192, 192, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-                # Add badge overlays (Galaxy, Gamepad)
-                scaled_pixmap = self.add_badges_overlay_large(scaled_pixmap, self.job)
-
-                self.icon_preview.setPixmap(scaled_pixmap)
-            else:
-                print(f"[ERROR] Failed to load icon pixmap from: {self.job.icon_path}")
-                no_image_text = "이미지 로드 실패" if tr.current_language == "ko" else "Failed to load image"
-                self.icon_preview.setText(no_image_text)
+            self.decode_preview("icon", self.job.icon_path)
         else:
-            print(f"[DEBUG] Icon path not found or doesn't exist: {self.job.icon_path}")
             no_image_text = "이미지 없음\n클릭하여 선택" if tr.current_language == "ko" else "No Image\nClick to select"
             self.icon_preview.setText(no_image_text)
 
     def change_icon(self):
         """Change icon image."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "아이콘 이미지 선택" if tr.current_language == "ko" else "Select Icon Image",
-            "",
-            "Images (*.png *.jpg *.jpeg);;All Files (*.*)"
-        )
+        file_path = open_file_dialog(self, 'icon')
         if file_path:
             self.job.icon_path = Path(file_path)
             self.job.icon_edited = True  # Mark as user-edited to force reprocessing
@@ -1216,22 +1556,55 @@ class EditGameDialog(QDialog):
 
     def change_banner(self):
         """Change banner image."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "배너 이미지 선택" if tr.current_language == "ko" else "Select Banner Image",
-            "",
-            "Images (*.png *.jpg *.jpeg);;All Files (*.*)"
-        )
+        file_path = open_file_dialog(self, 'banner')
         if file_path:
             self.job.banner_path = Path(file_path)
             self.job.banner_edited = True  # Mark as user-edited to force reprocessing
             print(f"[USER EDIT] Banner changed to: {file_path}")
-            pixmap = QPixmap(file_path)
-            self.banner_preview.setPixmap(pixmap.scaled(384, 216, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self.decode_preview("banner", self.job.banner_path)
+
+    def decode_preview(self, kind: str, path: Path):
+        """Show a cached icon/banner preview, or decode it on the thread pool."""
+        width, height = self.PREVIEW_SIZES[kind]
+        key = pixmap_cache_key(path, width, height)
+        pixmap = find_cached_pixmap(key)
+        if pixmap is not None:
+            self.show_preview(kind, path, pixmap)
+            return
+
+        task = ImageDecodeTask(self.job, kind, key, path, width, height)
+        task.signals.decoded.connect(self.on_preview_decoded)
+        QThreadPool.globalInstance().start(task)
+
+    def on_preview_decoded(self, job: BatchBuildJob, kind: str, key: str, image: QImage):
+        """Cache a preview decoded on the thread pool and show it."""
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+        self.show_preview(kind, key.rsplit('|', 2)[0], pixmap)
+
+    def show_preview(self, kind: str, path, pixmap: QPixmap):
+        """Put an icon/banner preview into its label."""
+        # The user may have picked another image while this one was decoding
+        current_path = self.job.icon_path if kind == "icon" else self.job.banner_path
+        if str(current_path) != str(path):
+            return
+        label = self.icon_preview if kind == "icon" else self.banner_preview
+
+        if pixmap.isNull():
+            print(f"[ERROR] Failed to load {kind} pixmap from: {path}")
+            no_image_text = "이미지 로드 실패" if tr.current_language == "ko" else "Failed to load image"
+            label.setText(no_image_text)
+            return
+
+        if kind == "icon":
+            # Add badge overlays (Galaxy, Gamepad)
+            pixmap = self.add_badges_overlay_large(pixmap, self.job)
+        label.setPixmap(pixmap)
 
     def add_badges_overlay_large(self, pixmap: QPixmap, job: BatchBuildJob) -> QPixmap:
         """Add badge overlays to larger pixmap (for edit dialog - 192x192)."""
-        from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+        from PyQt5.QtGui import QPainter, QPen, QBrush, QColor
         from PyQt5.QtCore import Qt, QRectF
 
         # Create a copy to draw on
@@ -1239,9 +1612,7 @@ class EditGameDialog(QDialog):
         painter = QPainter(result)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        font = QFont()
-        font.setPixelSize(10)
-        font.setBold(True)
+        font = cached_font(pixel_size=10, bold=True)
 
         # Galaxy patch badge (bottom-right)
         pad_option = job.pad_option or ""
@@ -1353,65 +1724,27 @@ class GamepadHelpDialog(QDialog):
         image_layout = QHBoxLayout()
         image_layout.setSpacing(4)
 
-        # Left arrow button
-        self.prev_btn = QPushButton("◀")
-        self.prev_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                padding: 8px;
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                min-width: 30px;
-                max-width: 30px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f8f8f8;
-                color: #ccc;
-            }
-        """)
-        self.prev_btn.clicked.connect(self.prev_image)
+        # Navigation arrows are only built when there is more than one image to page through
+        self.prev_btn = None
+        self.next_btn = None
         if not self.single_image_mode:
+            # Left arrow button
+            self.prev_btn = QPushButton("◀")
+            self.prev_btn.setObjectName("navArrowButton")
+            self.prev_btn.clicked.connect(self.prev_image)
             image_layout.addWidget(self.prev_btn)
 
         # Image label
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("background-color: white; border: 1px solid #ddd;")
-        self.image_label.setScaledContents(False)
+        self.image_label.setObjectName("mappingImage")
         image_layout.addWidget(self.image_label, 1)
 
-        # Right arrow button
-        self.next_btn = QPushButton("▶")
-        self.next_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                padding: 8px;
-                background-color: #f0f0f0;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                min-width: 30px;
-                max-width: 30px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f8f8f8;
-                color: #ccc;
-            }
-        """)
-        self.next_btn.clicked.connect(self.next_image)
         if not self.single_image_mode:
+            # Right arrow button
+            self.next_btn = QPushButton("▶")
+            self.next_btn.setObjectName("navArrowButton")
+            self.next_btn.clicked.connect(self.next_image)
             image_layout.addWidget(self.next_btn)
 
         layout.addLayout(image_layout)
@@ -1419,7 +1752,8 @@ class GamepadHelpDialog(QDialog):
         # Page indicator
         self.page_label = QLabel()
         self.page_label.setAlignment(Qt.AlignCenter)
-        self.page_label.setStyleSheet("font-size: 11px; color: #666; padding: 3px;")
+        self.page_label.setMargin(3)
+        set_palette_color(self.page_label, QPalette.WindowText, "#666", pixel_size=11)
         if not self.single_image_mode:
             layout.addWidget(self.page_label)
 
@@ -1429,24 +1763,7 @@ class GamepadHelpDialog(QDialog):
 
         close_btn = QPushButton(tr.get("close"))
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff6b6b, stop:1 #ee5555);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 12px; /* Consistent padding */
-                border: 1px solid #dd4444;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff5555, stop:1 #ee3333);
-                border-color: #cc2222;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ee3333, stop:1 #dd2222);
-            }
-        """)
+        close_btn.setObjectName("dialogCancelButton")
         close_layout.addWidget(close_btn)
         layout.addLayout(close_layout)
 
@@ -1489,14 +1806,9 @@ class GamepadHelpDialog(QDialog):
             img_path, title = self.images[index]
 
             # Load and display image
-            pixmap = QPixmap(img_path)
-            if not pixmap.isNull():
-                # Scale to fit window width (fill horizontally)
-                scaled_pixmap = pixmap.scaled(
-                    500, 330,  # Compact size to fit the dialog
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
+            # Scale to fit window width (compact size to fit the dialog)
+            scaled_pixmap = load_scaled_pixmap(img_path, 500, 330)
+            if not scaled_pixmap.isNull():
                 self.image_label.setPixmap(scaled_pixmap)
             else:
                 self.image_label.setText("이미지 로드 실패" if tr.current_language == "ko" else "Failed to load image")
@@ -1506,8 +1818,9 @@ class GamepadHelpDialog(QDialog):
             self.page_label.setText(page_text)
 
             # Update button states
-            self.prev_btn.setEnabled(index > 0)
-            self.next_btn.setEnabled(index < len(self.images) - 1)
+            if self.prev_btn is not None:
+                self.prev_btn.setEnabled(index > 0)
+                self.next_btn.setEnabled(index < len(self.images) - 1)
 
     def prev_image(self):
         """Show previous image."""
@@ -1520,9 +1833,139 @@ class GamepadHelpDialog(QDialog):
             self.show_image(self.current_index + 1)
 
 
+class CompatibilityTableModel(QAbstractTableModel):
+    """Table model for the compatibility list.
+
+    Holds one short list of display strings per game and computes cell
+    colors on demand, so only the visible cells are ever materialized.
+    """
+
+    # Columns of each row; the No. column (0) comes from self.numbers
+    CATEGORY, GAME_ID, TITLE, REGION, GAMEPAD, PATCH, HOST = range(7)
+    EDITABLE_COLUMNS = (2, 3)  # Game ID, Game Title
+
+    cell_edited = pyqtSignal(int, int, str)  # row, column, new text
+
+    # Cell colors, shared by every row
+    GREEN = QBrush(QColor(180, 255, 180))
+    BLUE = QBrush(QColor(180, 220, 255))
+    YELLOW = QBrush(QColor(255, 255, 180))
+    RED = QBrush(QColor(255, 180, 180))
+    GRAY = QBrush(QColor(210, 210, 210))
+    ORANGE = QBrush(QColor(255, 210, 170))
+    DIMMED_TEXT = QColor(180, 180, 180)
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.rows = []
+        self.numbers = []
+
+    def set_rows(self, rows):
+        """Replace all rows."""
+        self.beginResetModel()
+        self.rows = rows
+        self.numbers = [str(i + 1) for i in range(len(rows))]
+        self.endResetModel()
+
+    def set_numbers(self, numbers):
+        """Update the No. column, e.g. after filtering."""
+        self.numbers = numbers
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.rows) - 1, 0))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() in self.EDITABLE_COLUMNS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if column == 0:
+                return self.numbers[row]
+            return self.rows[row][column - 1]
+
+        if role == Qt.TextAlignmentRole:
+            if column in (0, 6):
+                return Qt.AlignCenter
+            return None
+
+        values = self.rows[row]
+        if role == Qt.BackgroundRole:
+            if column == 6:  # GCT Patch
+                patch_text = values[self.PATCH]
+                if patch_text == "Galaxy+CC":
+                    return self.GREEN
+                if patch_text == "Galaxy":
+                    return self.BLUE
+                if patch_text == "CC":
+                    return self.YELLOW
+            elif column == 5:  # Gamepad compatibility - considers patch availability
+                gamepad_lower = values[self.GAMEPAD].lower()
+                if 'works' in gamepad_lower and 'doesn\'t' not in gamepad_lower and 'partial' not in gamepad_lower:
+                    # Works - Green
+                    return self.GREEN
+                if 'partial' in gamepad_lower:
+                    # Partially works - Yellow
+                    return self.YELLOW
+                if 'doesn\'t' in gamepad_lower:
+                    if values[self.PATCH] != "-":
+                        # Doesn't work but has patch - Light blue (can force)
+                        return self.BLUE
+                    # Doesn't work and no patch - Light red
+                    return self.RED
+                if 'unknown' in gamepad_lower:
+                    # Unknown - Gray
+                    return self.GRAY
+                # Other/Issues - Light orange
+                return self.ORANGE
+            return None
+
+        if role == Qt.ForegroundRole and column == 6 and values[self.PATCH] == "-":
+            return self.DIMMED_TEXT
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() not in self.EDITABLE_COLUMNS:
+            return False
+        row, column = index.row(), index.column()
+        if self.rows[row][column - 1] == value:
+            return False
+        self.rows[row][column - 1] = value
+        self.dataChanged.emit(index, index)
+        self.cell_edited.emit(row, column, value)
+        return True
+
+
 class CompatibilityListDialog(QDialog):
     """Dialog to show compatibility list from database."""
 
+    # Gamepad filter combo texts (ko and en) -> filter applied in filter_table
+    GAMEPAD_FILTERS = {
+        "지원": "works", "Works": "works",
+        "일부지원": "partial", "Partial": "partial",
+        "강제가능": "force", "Force OK": "force",
+        "미지원": "broken", "Doesn't Work": "broken",
+        "알수없음": "unknown", "Unknown": "unknown",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Remove ? button from title bar
@@ -1591,7 +2034,12 @@ class CompatibilityListDialog(QDialog):
         search_label = QLabel("검색:" if tr.current_language == "ko" else "Search:")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("게임 이름 또는 ID..." if tr.current_language == "ko" else "Game name or ID...")
-        self.search_input.textChanged.connect(self.filter_table)
+        # Debounce typing so the table is filtered once per pause, not per key
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.filter_table)
+        self.search_input.textChanged.connect(self.search_timer.start)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input, 1)
 
@@ -1603,13 +2051,13 @@ class CompatibilityListDialog(QDialog):
         self.gamepad_combo.setMinimumWidth(90)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)  # Added No. column
         if tr.current_language == "ko":
             headers = ["No.", "카테고리", "게임 ID", "게임 제목", "지역", "게임패드 호환", "GCT 패치", "호스트 게임"]
         else:
             headers = ["No.", "Category", "Game ID", "Game Title", "Region", "Gamepad Compat", "GCT Patch", "Host Game"]
-        self.table.setHorizontalHeaderLabels(headers)
+        self.model = CompatibilityTableModel(headers, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.verticalHeader().setVisible(False)  # Hide default row numbers
         self.table.setColumnWidth(0, 45)   # No.
         self.table.setColumnWidth(1, 80)   # Category
@@ -1620,10 +2068,10 @@ class CompatibilityListDialog(QDialog):
         self.table.setColumnWidth(7, 150)  # Host Game
         # Use stretch for title column only
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)  # Game Title
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        # Allow editing only game_id column (column 0)
-        self.table.setEditTriggers(QTableWidget.DoubleClicked)
-        self.table.itemChanged.connect(self.on_item_changed)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        # Allow editing only game_id and title columns (see the model)
+        self.table.setEditTriggers(QTableView.DoubleClicked)
+        self.model.cell_edited.connect(self.on_item_changed)
 
         # Table styling - minimal to preserve cell background colors
         self.table.setShowGrid(True)
@@ -1635,52 +2083,19 @@ class CompatibilityListDialog(QDialog):
 
         # Result count label (left side)
         self.result_count_label = QLabel("")
-        self.result_count_label.setStyleSheet("color: #333; font-size: 12px;")
+        set_palette_color(self.result_count_label, QPalette.WindowText, "#333", pixel_size=12)
         btn_layout.addWidget(self.result_count_label)
 
         btn_layout.addStretch() # Push buttons to the right
 
         save_btn = QPushButton("저장" if tr.current_language == "ko" else "Save")
         save_btn.clicked.connect(self.save_changes)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5cb85c, stop:1 #4cae4c);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 12px; /* Reduced horizontal padding */
-                border: 1px solid #3d8b3d;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #6cc76c, stop:1 #5cb85c);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a9d4a, stop:1 #3d8b3d);
-            }
-        """)
+        save_btn.setObjectName("dialogSaveButton")
         btn_layout.addWidget(save_btn)
 
         close_btn = QPushButton(tr.get("close") if tr.current_language == "ko" else "Close")
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff6b6b, stop:1 #ee5555);
-                color: white;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 10px 12px; /* Reduced horizontal padding */
-                border: 1px solid #dd4444;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ff5555, stop:1 #ee3333);
-                border-color: #cc2222;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #ee3333, stop:1 #dd2222);
-            }
-        """)
+        close_btn.setObjectName("dialogCancelButton")
         btn_layout.addWidget(close_btn)
 
         layout.addLayout(btn_layout)
@@ -1692,34 +2107,17 @@ class CompatibilityListDialog(QDialog):
         from .cc_patch_manager import get_cc_patch_manager
         patch_manager = get_cc_patch_manager()
 
-        games = compatibility_db.get_all_games()
+        db = get_compatibility_db()
+        self.loaded_generation = db.generation
+        games = db.get_all_games()
         self.all_games = games
 
-        self.table.setRowCount(len(games))
-        for row, game in enumerate(games):
-            # No. (column 0) - will be updated by filter_table
-            no_item = QTableWidgetItem(str(row + 1))
-            no_item.setTextAlignment(Qt.AlignCenter)
-            no_item.setFlags(no_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 0, no_item)
-
-            # Category (column 1)
-            category = game.get('category', 'Wii')
-            self.table.setItem(row, 1, QTableWidgetItem(category))
-
-            # Game ID (column 2)
-            game_id = game.get('game_id', '')
-            self.table.setItem(row, 2, QTableWidgetItem(game_id))
+        rows = []
+        for game in games:
+            game_id = game['game_id']
 
-            # Title (column 3)
-            self.table.setItem(row, 3, QTableWidgetItem(game.get('title', '')))
-
-            # Region (column 4)
-            self.table.setItem(row, 4, QTableWidgetItem(game.get('region', '')))
-
-            # GCT Patch availability (column 6) - check first for gamepad color
+            # GCT Patch availability - also decides the gamepad color
             patches = patch_manager.get_available_patches(game_id) if game_id else []
-            has_patch = len(patches) > 0
             if patches:
                 patch_types = [p['patch_type'] for p in patches]
                 has_galaxy = 'allstars' in patch_types or 'nvidia' in patch_types
@@ -1727,73 +2125,43 @@ class CompatibilityListDialog(QDialog):
 
                 if has_galaxy and has_cc:
                     patch_text = "Galaxy+CC"
-                    patch_item = QTableWidgetItem(patch_text)
-                    patch_item.setBackground(QBrush(QColor(180, 255, 180)))  # Green
                 elif has_galaxy:
                     patch_text = "Galaxy"
-                    patch_item = QTableWidgetItem(patch_text)
-                    patch_item.setBackground(QBrush(QColor(180, 220, 255)))  # Blue
                 else:
                     patch_text = "CC"
-                    patch_item = QTableWidgetItem(patch_text)
-                    patch_item.setBackground(QBrush(QColor(255, 255, 180)))  # Yellow
             else:
-                patch_item = QTableWidgetItem("-")
-                patch_item.setForeground(QColor(180, 180, 180))
-            patch_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 6, patch_item)
-
-            # Gamepad compatibility with color (column 5) - considers patch availability
-            gamepad = game.get('gamepad_compatibility') or 'Unknown'
-            gamepad_lower = gamepad.lower()
-            gamepad_item = QTableWidgetItem(gamepad)
-
-            if 'works' in gamepad_lower and 'doesn\'t' not in gamepad_lower and 'partial' not in gamepad_lower:
-                # Works - Green
-                gamepad_item.setBackground(QBrush(QColor(180, 255, 180)))
-            elif 'partial' in gamepad_lower:
-                # Partially works - Yellow
-                gamepad_item.setBackground(QBrush(QColor(255, 255, 180)))
-            elif 'doesn\'t' in gamepad_lower:
-                if has_patch:
-                    # Doesn't work but has patch - Light blue (can force)
-                    gamepad_item.setBackground(QBrush(QColor(180, 220, 255)))
-                else:
-                    # Doesn't work and no patch - Light red
-                    gamepad_item.setBackground(QBrush(QColor(255, 180, 180)))
-            elif 'unknown' in gamepad_lower:
-                # Unknown - Gray
-                gamepad_item.setBackground(QBrush(QColor(210, 210, 210)))
-            else:
-                # Other/Issues - Light orange
-                gamepad_item.setBackground(QBrush(QColor(255, 210, 170)))
-            self.table.setItem(row, 5, gamepad_item)
+                patch_text = "-"
+
+            rows.append([
+                game['category'] or "",
+                game_id or "",
+                game['title'] or "",
+                game['region'] or "",
+                game['gamepad_compatibility'] or 'Unknown',
+                patch_text,
+                game['host_game'] or "",
+            ])
 
-            # Host game (column 7)
-            self.table.setItem(row, 7, QTableWidgetItem(game.get('host_game', '')))
+        self.model.set_rows(rows)
 
         # Update initial count
         self.filter_table()
 
-    def on_item_changed(self, item):
+    def reload_if_changed(self):
+        """Before reopening: drop unsaved edits and pick up DB writes made meanwhile."""
+        if self.changes or self.loaded_generation != get_compatibility_db().generation:
+            self.changes.clear()
+            self.load_data()
+
+    def on_item_changed(self, row, column, text):
         """Track changes to game_id or title column."""
-        row = item.row()
-        if item.column() == 2:  # game_id column
-            title_item = self.table.item(row, 3)
-            region_item = self.table.item(row, 4)
-            if title_item and region_item:
-                # Use original title from all_games
-                orig_title = self.all_games[row]['title']
-                region = region_item.text()
-                key = ('game_id', orig_title, region)
-                self.changes[key] = item.text()
-        elif item.column() == 3:  # title column
-            region_item = self.table.item(row, 4)
-            if region_item:
-                orig_title = self.all_games[row]['title']
-                region = region_item.text()
-                key = ('title', orig_title, region)
-                self.changes[key] = item.text()
+        # Use original title from all_games
+        orig_title = self.all_games[row]['title']
+        region = self.model.rows[row][CompatibilityTableModel.REGION]
+        if column == 2:  # game_id column
+            self.changes[('game_id', orig_title, region)] = text
+        elif column == 3:  # title column
+            self.changes[('title', orig_title, region)] = text
 
     def save_changes(self):
         """Save all changes to database."""
@@ -1805,9 +2173,9 @@ class CompatibilityListDialog(QDialog):
         for key, value in self.changes.items():
             change_type, orig_title, region = key
             if change_type == 'game_id':
-                compatibility_db.update_game_id(orig_title, region, value)
+                get_compatibility_db().update_game_id(orig_title, region, value)
             elif change_type == 'title':
-                compatibility_db.update_title(orig_title, region, value)
+                get_compatibility_db().update_title(orig_title, region, value)
 
         count = len(self.changes)
         self.changes.clear()
@@ -1826,94 +2194,98 @@ class CompatibilityListDialog(QDialog):
         selected_gamepad = self.gamepad_combo.currentText()
         gct_filter_enabled = self.gct_filter_checkbox.isChecked()
 
-        for row in range(self.table.rowCount()):
-            # Get values from columns (shifted by 1 due to No. column)
-            category = self.table.item(row, 1).text() if self.table.item(row, 1) else "Wii"
-            region = self.table.item(row, 4).text() if self.table.item(row, 4) else ""
-            gamepad = self.table.item(row, 5).text().lower() if self.table.item(row, 5) else ""
-            patch_item = self.table.item(row, 6)
-
-            # Filter by category
-            if selected_category not in ["전체", "All"] and category != selected_category:
-                self.table.setRowHidden(row, True)
-                continue
+        # Resolve the combo choices once, not per row ("전체"/"All" = no filter)
+        all_texts = ("전체", "All")
+        category_filter = None if selected_category in all_texts else selected_category
+        if selected_region in all_texts:
+            region_filter = None
+        elif selected_region == "JPN":
+            region_filter = ("JPN", "JAP")  # JAP and JPN are treated the same
+        else:
+            region_filter = (selected_region,)
+        gamepad_filter = self.GAMEPAD_FILTERS.get(selected_gamepad)
 
-            # Filter by region (JAP and JPN are treated the same)
-            if selected_region not in ["전체", "All"]:
-                if selected_region == "JPN":
-                    if region not in ["JPN", "JAP"]:
-                        self.table.setRowHidden(row, True)
-                        continue
-                elif region != selected_region:
-                    self.table.setRowHidden(row, True)
+        set_row_hidden = self.table.setRowHidden
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row, values in enumerate(self.model.rows):
+                category = values[CompatibilityTableModel.CATEGORY]
+                region = values[CompatibilityTableModel.REGION]
+                gamepad = values[CompatibilityTableModel.GAMEPAD].lower()
+                patch_text = values[CompatibilityTableModel.PATCH]
+
+                # Filter by category
+                if category_filter is not None and category != category_filter:
+                    set_row_hidden(row, True)
                     continue
 
-            # Filter by gamepad compatibility
-            if selected_gamepad not in ["전체", "All"]:
-                patch_text = patch_item.text() if patch_item else "-"
-                has_patch = patch_text != "-"
+                # Filter by region
+                if region_filter is not None and region not in region_filter:
+                    set_row_hidden(row, True)
+                    continue
 
-                if selected_gamepad in ["지원", "Works"]:
-                    # Works (not partially, not doesn't)
-                    if "works" not in gamepad or "doesn't" in gamepad or "partial" in gamepad:
-                        self.table.setRowHidden(row, True)
-                        continue
-                elif selected_gamepad in ["일부지원", "Partial"]:
-                    # Partially works
-                    if "partial" not in gamepad:
-                        self.table.setRowHidden(row, True)
-                        continue
-                elif selected_gamepad in ["강제가능", "Force OK"]:
-                    # Has GCT patch (can force gamepad support)
-                    if not has_patch:
-                        self.table.setRowHidden(row, True)
-                        continue
-                elif selected_gamepad in ["미지원", "Doesn't Work"]:
-                    # Doesn't work and no patch
-                    if not ("doesn't" in gamepad and not has_patch):
-                        self.table.setRowHidden(row, True)
-                        continue
-                elif selected_gamepad in ["알수없음", "Unknown"]:
-                    if "unknown" not in gamepad:
-                        self.table.setRowHidden(row, True)
+                # Filter by gamepad compatibility
+                if gamepad_filter is not None:
+                    has_patch = patch_text != "-"
+
+                    if gamepad_filter == "works":
+                        # Works (not partially, not doesn't)
+                        hidden = "works" not in gamepad or "doesn't" in gamepad or "partial" in gamepad
+                    elif gamepad_filter == "partial":
+                        # Partially works
+                        hidden = "partial" not in gamepad
+                    elif gamepad_filter == "force":
+                        # Has GCT patch (can force gamepad support)
+                        hidden = not has_patch
+                    elif gamepad_filter == "broken":
+                        # Doesn't work and no patch
+                        hidden = not ("doesn't" in gamepad and not has_patch)
+                    else:  # unknown
+                        hidden = "unknown" not in gamepad
+                    if hidden:
+                        set_row_hidden(row, True)
                         continue
 
-            # Filter by GCT patch availability (column 6)
-            if gct_filter_enabled:
-                if not patch_item or patch_item.text() == "-":
-                    self.table.setRowHidden(row, True)
-                    continue
-
-            # Filter by search text
-            if search_text:
-                match = False
-                for col in range(1, self.table.columnCount()):  # Skip No. column
-                    item = self.table.item(row, col)
-                    if item and search_text in item.text().lower():
-                        match = True
-                        break
-                self.table.setRowHidden(row, not match)
-            else:
-                self.table.setRowHidden(row, False)
+                # Filter by GCT patch availability (column 6)
+                if gct_filter_enabled:
+                    if patch_text == "-":
+                        set_row_hidden(row, True)
+                        continue
 
-        # Update No. column with sequential numbers for visible rows
-        visible_num = 0
-        for row in range(self.table.rowCount()):
-            if not self.table.isRowHidden(row):
-                visible_num += 1
-                no_item = self.table.item(row, 0)
-                if no_item:
-                    no_item.setText(str(visible_num))
+                # Filter by search text
+                if search_text:
+                    match = any(search_text in value.lower() for value in values)
+                    set_row_hidden(row, not match)
+                else:
+                    set_row_hidden(row, False)
+
+            # Update No. column with sequential numbers for visible rows
+            visible_num = 0
+            numbers = []
+            for row in range(len(self.model.rows)):
+                if self.table.isRowHidden(row):
+                    numbers.append("")
+                else:
+                    visible_num += 1
+                    numbers.append(str(visible_num))
+            self.model.set_numbers(numbers)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
         # Update result count
         visible_count = visible_num
-        total_count = self.table.rowCount()
+        total_count = len(self.model.rows)
         if tr.current_language == "ko":
             self.result_count_label.setText(f"결과: {visible_count}/{total_count}")
         else:
             self.result_count_label.setText(f"Results: {visible_count}/{total_count}")
 
 
+# State bits of the remove/clear buttons (see update_main_buttons_state)
+MAIN_BUTTONS_HAS_SELECTION = 1 << 0
+MAIN_BUTTONS_HAS_ROWS = 1 << 1
+
+
 class BatchWindow(QMainWindow):
     """Simplified batch build window."""
 
@@ -1923,8 +2295,19 @@ class BatchWindow(QMainWindow):
         self.batch_builder = None
         self.loader_thread = None
         self.available_bases = {}  # Will be populated from settings
+        self.main_buttons_state = None  # MAIN_BUTTONS_* bits last applied to remove/clear
+        self.settings_dialog = None  # Created on first use, then reused
+        self.compat_dialog = None
+        # Build progress is polled from the builder instead of signalled per tick
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(50)
+        self.progress_timer.timeout.connect(self.poll_build_progress)
+        # Scaled previews (table and edit dialog) share QPixmapCache; 32 MB
+        QPixmapCache.setCacheLimit(32 * 1024)
         self.init_ui()
         self.load_available_bases()  # Load on startup
+        # Warm TOOLDIR off the GUI thread so the window paints first
+        QThreadPool.globalInstance().start(ToolProvisionTask())
 
     def init_ui(self):
         """Initialize UI."""
@@ -1953,49 +2336,25 @@ class BatchWindow(QMainWindow):
         top_layout = QHBoxLayout()
         top_layout.setSpacing(8)
 
-        # Modern button style with icon spacing
-        btn_style = """
-            QPushButton {
-                background-color: #f5f5f5;
-                color: #333;
-                border: 1px solid #ddd;
-                padding: 8px 16px 8px 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-                border-color: #bbb;
-            }
-            QPushButton:pressed {
-                background-color: #ddd;
-            }
-            QPushButton[interactive="false"] {
-                background-color: #f0f0f0;
-                color: #aaa;
-                border-color: #e0e0e0;
-            }
-        """
-
+        # Buttons are styled as #toolbarButton in app.qss
         # Add Files button
         self.add_btn = QPushButton("  " + tr.get("add_files"))  # Add spacing before text
         self.add_btn.setIcon(self.style().standardIcon(QStyle.SP_DirOpenIcon))
-        self.add_btn.setStyleSheet(btn_style)
+        self.add_btn.setObjectName("toolbarButton")
         self.add_btn.clicked.connect(self.add_games)
         top_layout.addWidget(self.add_btn)
 
         # Remove Selected button
         self.remove_btn = QPushButton("  " + tr.get("remove_selected"))  # Add spacing
         self.remove_btn.setIcon(self.style().standardIcon(QStyle.SP_BrowserStop))
-        self.remove_btn.setStyleSheet(btn_style)
+        self.remove_btn.setObjectName("toolbarButton")
         self.remove_btn.clicked.connect(self.remove_selected)
         top_layout.addWidget(self.remove_btn)
 
         # Clear All button
         self.clear_btn = QPushButton("  " + tr.get("clear_all"))  # Add spacing
         self.clear_btn.setIcon(self.style().standardIcon(QStyle.SP_TrashIcon))
-        self.clear_btn.setStyleSheet(btn_style)
+        self.clear_btn.setObjectName("toolbarButton")
         self.clear_btn.clicked.connect(self.clear_all)
         top_layout.addWidget(self.clear_btn)
 
@@ -2003,25 +2362,7 @@ class BatchWindow(QMainWindow):
         compat_text = "호환성 목록" if tr.current_language == "ko" else "Compatibility"
         self.compat_btn = QPushButton("  " + compat_text)  # Add spacing
         self.compat_btn.setIcon(self.style().standardIcon(QStyle.SP_MessageBoxInformation))
-        self.compat_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E3F2FD; /* Very light blue background */
-                color: #2196F3; /* Blue text */
-                border: 1px solid #90CAF9; /* Light blue border */
-                padding: 8px 16px 8px 12px; /* Match other buttons */
-                border-radius: 6px; /* Match other buttons */
-                font-size: 13px; /* Match other buttons */
-                text-align: left; /* Match other buttons */
-            }
-            QPushButton:hover {
-                background-color: #BBDEFB; /* Slightly darker blue on hover */
-                border-color: #64B5F6;
-            }
-            QPushButton:pressed {
-                background-color: #90CAF9; /* Even darker on pressed */
-                border-color: #42A5F5;
-            }
-        """)
+        self.compat_btn.setObjectName("compatButton")  # Light blue, see app.qss
         self.compat_btn.clicked.connect(self.show_compatibility_list)
 
         top_layout.addStretch()
@@ -2037,9 +2378,9 @@ class BatchWindow(QMainWindow):
         self.keep_temp_check.setVisible(False)
 
         # Settings button (with gear icon)
-        settings_text = "⚙  설정" if tr.current_language == "ko" else "⚙  Settings"
-        self.settings_btn = QPushButton(settings_text)
-        self.settings_btn.setStyleSheet(btn_style)
+        settings_text = "설정" if tr.current_language == "ko" else "Settings"
+        self.settings_btn = QPushButton(emoji_icon("⚙"), settings_text)
+        self.settings_btn.setObjectName("toolbarButton")
         self.settings_btn.clicked.connect(self.show_settings)
         top_layout.addWidget(self.settings_btn)
 
@@ -2047,8 +2388,8 @@ class BatchWindow(QMainWindow):
 
         # Search filter
         search_layout = QHBoxLayout()
-        search_label = QLabel("🔍")
-        search_label.setStyleSheet("font-size: 14px;")
+        search_label = QLabel()
+        search_label.setPixmap(emoji_icon("🔍", 16).pixmap(16, 16))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("검색 (게임명, ID)..." if tr.current_language == "ko" else "Search (title, ID)...")
         self.search_input.setClearButtonEnabled(True)
@@ -2280,19 +2621,7 @@ class BatchWindow(QMainWindow):
 
     def add_games(self):
         """Add game files to batch queue asynchronously."""
-        if tr.current_language == "ko":
-            dialog_title = "게임 파일 선택"
-            file_filter = "게임 파일 (*.iso *.wbfs *.nkit.iso *.iso.dec *.gcm);;모든 파일 (*.*)"
-        else:
-            dialog_title = "Select Game Files"
-            file_filter = "Game Files (*.iso *.wbfs *.nkit.iso *.iso.dec *.gcm);;All Files (*.*)"
-
-        file_paths, _ = QFileDialog.getOpenFileNames(
-            self,
-            dialog_title,
-            "",
-            file_filter
-        )
+        file_paths = open_file_dialog(self, 'games', multiple=True)
 
         if not file_paths:
             return
@@ -2503,11 +2832,16 @@ class BatchWindow(QMainWindow):
         # Add job to list
         self.jobs.append(job)
 
-        # Add to table immediately
-        row_index = self.add_job_to_table(job)
+        # Add to table immediately; the row's six cell widgets are laid out
+        # and painted once instead of after each setCellWidget
+        self.table.setUpdatesEnabled(False)
+        try:
+            row_index = self.add_job_to_table(job)
 
-        # Update icon if already downloaded
-        self.update_icon_preview(row_index, job)
+            # Update icon if already downloaded
+            self.update_icon_preview(row_index, job)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
         # Update status
         if tr.current_language == "ko":
@@ -2534,7 +2868,7 @@ class BatchWindow(QMainWindow):
 
     def add_badges_overlay(self, pixmap: QPixmap, job: BatchBuildJob) -> QPixmap:
         """Add badge overlays to pixmap (Galaxy patch, Gamepad) - for 50x50 table icons."""
-        from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+        from PyQt5.QtGui import QPainter, QPen, QBrush, QColor
         from PyQt5.QtCore import Qt, QRectF
 
         # Create a copy to draw on
@@ -2542,9 +2876,7 @@ class BatchWindow(QMainWindow):
         painter = QPainter(result)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        font = QFont()
-        font.setPixelSize(5)
-        font.setBold(True)
+        font = cached_font(pixel_size=5, bold=True)
 
         # Galaxy patch badge (bottom-right)
         pad_option = job.pad_option or ""
@@ -2646,54 +2978,70 @@ class BatchWindow(QMainWindow):
 
     def update_icon_preview(self, row: int, job: BatchBuildJob):
         """Update icon and banner preview in table."""
-        # Update icon (Column 2) - Use QLabel for center alignment
+        # Update icon (Column 2) - decoded in the background, see on_preview_decoded
         if job.icon_path and job.icon_path.exists():
-            pixmap = QPixmap(str(job.icon_path))
             # Scale to 50x50 to fit better in 55px row height
-            scaled_pixmap = pixmap.scaled(52, 52, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-            # Add badge overlays (Galaxy, Gamepad) - visual only, doesn't modify original
-            scaled_pixmap = self.add_badges_overlay(scaled_pixmap, job)
-
-            icon_label = QLabel()
-            icon_label.setPixmap(scaled_pixmap)
-            icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setStyleSheet("background: transparent;")
-            self.table.setCellWidget(row, 2, icon_label)
+            self.decode_preview(job, "icon", job.icon_path, 52, 52)
         else:
             # Create a red X icon for failed download
             icon_item = QTableWidgetItem("X")
             icon_item.setTextAlignment(Qt.AlignCenter)
             icon_item.setForeground(QColor(255, 0, 0))
-            font = QFont()
-            font.setPointSize(24)
-            font.setBold(True)
-            icon_item.setFont(font)
+            icon_item.setFont(cached_font(point_size=24, bold=True))
             icon_item.setBackground(QColor(255, 240, 240))
             self.table.setItem(row, 2, icon_item)
 
-        # Update banner (Column 3) - Use QLabel for center alignment
+        # Update banner (Column 3)
         if job.banner_path and job.banner_path.exists():
-            pixmap = QPixmap(str(job.banner_path))
             # Scale to 89x50 to fit better in 55px row height (16:9 ratio)
-            scaled_pixmap = pixmap.scaled(92, 52, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            banner_label = QLabel()
-            banner_label.setPixmap(scaled_pixmap)
-            banner_label.setAlignment(Qt.AlignCenter)
-            banner_label.setStyleSheet("background: transparent;")
-            self.table.setCellWidget(row, 3, banner_label)
+            self.decode_preview(job, "banner", job.banner_path, 92, 52)
         else:
             # Create a red X for failed banner
             banner_item = QTableWidgetItem("X")
             banner_item.setTextAlignment(Qt.AlignCenter)
             banner_item.setForeground(QColor(255, 0, 0))
-            font = QFont()
-            font.setPointSize(20)
-            font.setBold(True)
-            banner_item.setFont(font)
+            banner_item.setFont(cached_font(point_size=20, bold=True))
             banner_item.setBackground(QColor(255, 240, 240))
             self.table.setItem(row, 3, banner_item)
 
+    def decode_preview(self, job: BatchBuildJob, kind: str, path: Path, width: int, height: int):
+        """Show a cached preview, or decode it on the thread pool."""
+        key = pixmap_cache_key(path, width, height)
+        pixmap = find_cached_pixmap(key)
+        if pixmap is not None:
+            self.show_preview(job, kind, path, pixmap)
+            return
+
+        task = ImageDecodeTask(job, kind, key, path, width, height)
+        task.signals.decoded.connect(self.on_preview_decoded)
+        QThreadPool.globalInstance().start(task)
+
+    def on_preview_decoded(self, job: BatchBuildJob, kind: str, key: str, image: QImage):
+        """Cache a preview decoded on the thread pool and show it."""
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+        self.show_preview(job, kind, key.rsplit('|', 2)[0], pixmap)
+
+    def show_preview(self, job: BatchBuildJob, kind: str, path, pixmap: QPixmap):
+        """Put an icon/banner preview into the job's row."""
+        # The job may have been removed or given another image meanwhile
+        current_path = job.icon_path if kind == "icon" else job.banner_path
+        if job not in self.jobs or str(current_path) != str(path):
+            return
+        row = self.jobs.index(job)
+
+        if kind == "icon":
+            # Add badge overlays (Galaxy, Gamepad) - visual only, doesn't modify original
+            pixmap = self.add_badges_overlay(pixmap, job)
+
+        # Use QLabel for center alignment
+        label = QLabel()
+        label.setPixmap(pixmap)
+        label.setAlignment(Qt.AlignCenter)
+        label.setObjectName("rowPreview")
+        self.table.setCellWidget(row, 2 if kind == "icon" else 3, label)
+
     def add_job_to_table(self, job: BatchBuildJob):
         """Add job to table and return row index."""
         row = self.table.rowCount()
@@ -2701,30 +3049,22 @@ class BatchWindow(QMainWindow):
         self.table.setRowHeight(row, 56)
 
         # Column 0: Game title / File name (Combined)
-        title_widget = QWidget()
-        title_widget.setAttribute(Qt.WA_TranslucentBackground)
-        title_layout = QVBoxLayout(title_widget)
-        title_layout.setContentsMargins(4, 0, 4, 0)
-        title_layout.setSpacing(0)
+        title_widget, title_layout = make_cell_container((4, 0, 4, 0), 0)
         title_label = QLabel(job.title_name)
-        title_label.setStyleSheet("font-size: 12px; font-weight: 500; color: #000; background: transparent;")
+        title_label.setObjectName("rowTitle")
         title_layout.addWidget(title_label)
         filename_label = QLabel(job.game_path.name)
-        filename_label.setStyleSheet("font-size: 11px; color: #666; background: transparent;")
+        filename_label.setObjectName("rowFileName")
         title_layout.addWidget(filename_label)
         self.table.setCellWidget(row, 0, title_widget)
 
         # Column 1: Game ID and Wiilink Status
-        id_widget = QWidget()
-        id_widget.setAttribute(Qt.WA_TranslucentBackground)
-        id_layout = QVBoxLayout(id_widget)
-        id_layout.setContentsMargins(2, 1, 2, 1)
-        id_layout.setSpacing(1)
+        id_widget, id_layout = make_cell_container((2, 1, 2, 1), 1)
         id_layout.setAlignment(Qt.AlignCenter)
         game_id = job.game_info.get('game_id', '') if job.game_info else ''
         game_id_label = QLabel(game_id)
         game_id_label.setAlignment(Qt.AlignCenter)
-        game_id_label.setStyleSheet("background: transparent;")
+        game_id_label.setObjectName("rowGameId")
         id_layout.addWidget(game_id_label)
         self.table.setCellWidget(row, 1, id_widget)
 
@@ -2734,28 +3074,17 @@ class BatchWindow(QMainWindow):
             self.table.setItem(row, i, item)
 
         # Column 4: Compatibility / Pad Option
-        compat_widget = QWidget()
-        compat_widget.setAttribute(Qt.WA_TranslucentBackground)
-        compat_layout = QVBoxLayout(compat_widget)
-        compat_layout.setContentsMargins(4, 0, 4, 4)
-        compat_layout.setSpacing(3)
+        compat_widget, compat_layout = make_cell_container((4, 0, 4, 4), 3)
         gamepad_compat = job.gamepad_compatibility or "Unknown"
         compat_label = QLabel(gamepad_compat)
         compat_label.setAlignment(Qt.AlignCenter)
         compat_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         compat_label.setFixedHeight(22)
-        gamepad_lower = gamepad_compat.lower()
-        if 'works' in gamepad_lower and 'doesn\'t' not in gamepad_lower:
-            compat_label.setStyleSheet("background-color: #c8ffc8; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #80c080;")
-        elif 'classic' in gamepad_lower or 'lr' in gamepad_lower:
-            compat_label.setStyleSheet("background-color: #ffffc8; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #c0c080;")
-        elif 'unknown' in gamepad_lower:
-            compat_label.setStyleSheet("background-color: #dcdcdc; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #a0a0a0;")
-        else:
-            compat_label.setStyleSheet("background-color: #ffc8c8; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #c08080;")
+        compat_label.setObjectName("compatBadge")
+        compat_label.setProperty("compat", compat_badge_value(gamepad_compat))
         compat_layout.addWidget(compat_label)
         pad_combo = QComboBox()
-        pad_combo.setStyleSheet("font-size: 11px;")
+        pad_combo.setObjectName("padCombo")
         pad_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         pad_combo.setFixedHeight(22)
         
@@ -2765,8 +3094,7 @@ class BatchWindow(QMainWindow):
         else:
             base_options = ["No Pad (Wiimote)", "Gamepad", "Gamepad (Force)", "Gamepad + LR (Force)", "Pad Wiimote(↕)", "Pad Wiimote(↔)"]
         
-        # Check for available GCT patches for this game
-        game_id = job.game_info.get('game_id', '') if job.game_info else ''
+        # Check for available GCT patches for this game (game_id from column 1)
         gct_options = []  # Will store (display_name, patch_type) tuples
         
         if game_id:
@@ -2818,11 +3146,12 @@ class BatchWindow(QMainWindow):
         if gct_options:
             pad_combo.insertSeparator(pad_combo.count())
 
-        for display_name, patch_type in gct_options:
-            pad_combo.addItem(display_name)
+            gct_start = pad_combo.count()
+            pad_combo.addItems([display_name for display_name, _patch_type in gct_options])
             # GCT patch options (Yellow)
-            idx = pad_combo.count() - 1
-            pad_combo.setItemData(idx, QBrush(QColor(255, 255, 180)), Qt.BackgroundRole)
+            gct_brush = QBrush(QColor(255, 255, 180))
+            for idx in range(gct_start, pad_combo.count()):
+                pad_combo.setItemData(idx, gct_brush, Qt.BackgroundRole)
 
         # Store GCT option count for style update
         gct_start_index = 7 if gct_options else -1
@@ -2840,23 +3169,20 @@ class BatchWindow(QMainWindow):
         self.table.setCellWidget(row, 4, compat_widget)
 
         # Column 5: Actions (Status + Edit button)
-        action_widget = QWidget()
-        action_widget.setAttribute(Qt.WA_TranslucentBackground)
-        action_layout = QVBoxLayout(action_widget)
-        action_layout.setContentsMargins(4, 0, 4, 4)
-        action_layout.setSpacing(3)
+        action_widget, action_layout = make_cell_container((4, 0, 4, 4), 3)
         status_text = "대기 중" if tr.current_language == "ko" else "Pending"
         status_label = QLabel(status_text)
         status_label.setAlignment(Qt.AlignCenter)
         status_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         status_label.setFixedHeight(22)
-        status_label.setStyleSheet("background-color: #fff9c4; border: 1px solid #fbc02d; color: #8c6b00; font-size: 11px; padding: 2px 5px; border-radius: 3px;")
+        status_label.setObjectName("statusBadge")
+        status_label.setProperty("state", "pending")
         action_layout.addWidget(status_label)
         edit_text = "편집" if tr.current_language == "ko" else "Edit"
         edit_btn = QPushButton(edit_text)
         edit_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         edit_btn.setFixedHeight(22)
-        edit_btn.setStyleSheet("QPushButton { background-color: #fafafa; color: #555; border: 1px solid #ddd; padding: 4px 12px; border-radius: 4px; font-size: 11px; } QPushButton:hover { background-color: #f0f0f0; color: #333; border-color: #bbb; } QPushButton:disabled { background-color: #f0f0f0; color: #aaa; border-color: #e0e0e0; }")
+        edit_btn.setObjectName("rowEditButton")
         edit_btn.clicked.connect(lambda checked, btn=edit_btn: self.edit_game_by_button(btn))
         action_layout.addWidget(edit_btn)
         self.table.setCellWidget(row, 5, action_widget)
@@ -2864,6 +3190,24 @@ class BatchWindow(QMainWindow):
         self.update_main_buttons_state() # Update button states after adding a job
         return row
 
+    def row_status_label(self, row: int) -> Optional[QLabel]:
+        """
+        Get the status badge of a table row.
+
+        Args:
+            row: Table row
+
+        Returns:
+            The row's status QLabel, or None if the row doesn't exist
+        """
+        if row >= self.table.rowCount():
+            return None
+        action_widget = self.table.cellWidget(row, 5)
+        if not action_widget:
+            return None
+        # Column 5 holds [status label, edit button] (see add_job_to_table)
+        return action_widget.layout().itemAt(0).widget()
+
     def edit_game(self, row, column):
         """Edit game metadata (사용 안 함 - 편집 버튼으로만 수정)."""
         # 더블클릭 편집 비활성화됨
@@ -2875,7 +3219,7 @@ class BatchWindow(QMainWindow):
         for row in range(self.table.rowCount()):
             # The button is inside a widget in column 5 now
             action_widget = self.table.cellWidget(row, 5)
-            if action_widget and button in action_widget.findChildren(QPushButton):
+            if action_widget and action_widget.layout().itemAt(1).widget() is button:
                 if row < len(self.jobs):
                     dialog = EditGameDialog(self.jobs[row], self.available_bases, self)
                     if dialog.exec_():
@@ -2966,71 +3310,47 @@ class BatchWindow(QMainWindow):
         Enables or disables the remove_btn based on whether there are selected items in the table,
         and the clear_btn based on whether there are any rows in the table.
         Also updates the cursor to indicate if the button is interactive.
+
+        Runs on every selection change, so the buttons are only restyled
+        when the combined state actually changes.
         """
-        has_selection = self.table.selectionModel().hasSelection()
-        has_rows = self.table.rowCount() > 0
+        state = 0
+        if self.table.selectionModel().hasSelection():
+            state |= MAIN_BUTTONS_HAS_SELECTION
+        if self.table.rowCount() > 0:
+            state |= MAIN_BUTTONS_HAS_ROWS
+        if state == self.main_buttons_state:
+            return
+        self.main_buttons_state = state
+        has_selection = bool(state & MAIN_BUTTONS_HAS_SELECTION)
+        has_rows = bool(state & MAIN_BUTTONS_HAS_ROWS)
 
-        # Store property for click handler checks
-        self.remove_btn.setProperty("interactive", "true" if has_selection else "false")
-        self.clear_btn.setProperty("interactive", "true" if has_rows else "false")
+        # The property drives the click handler checks and the
+        # #toolbarButton[interactive="false"] style
+        set_style_property(self.remove_btn, "interactive", "true" if has_selection else "false")
+        set_style_property(self.clear_btn, "interactive", "true" if has_rows else "false")
 
         # Get normal icons once
         normal_remove_icon = self.style().standardIcon(QStyle.SP_BrowserStop)
         normal_clear_icon = self.style().standardIcon(QStyle.SP_TrashIcon)
 
-        # Base button style
-        active_style = """
-            QPushButton {
-                background-color: #f5f5f5;
-                color: #333;
-                border: 1px solid #ddd;
-                padding: 8px 16px 8px 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-                border-color: #bbb;
-            }
-            QPushButton:pressed {
-                background-color: #ddd;
-            }
-        """
-
-        inactive_style = """
-            QPushButton {
-                background-color: #f0f0f0;
-                color: #aaa;
-                border: 1px solid #e0e0e0;
-                padding: 8px 16px 8px 12px;
-                border-radius: 6px;
-                font-size: 13px;
-                text-align: left;
-            }
-        """
-
         # Update remove button
         if has_selection:
             self.remove_btn.setCursor(Qt.ArrowCursor)
             self.remove_btn.setIcon(normal_remove_icon)
-            self.remove_btn.setStyleSheet(active_style)
         else:
             pixmap = normal_remove_icon.pixmap(self.remove_btn.iconSize(), QIcon.Disabled)
             self.remove_btn.setIcon(QIcon(pixmap))
             self.remove_btn.setCursor(Qt.ForbiddenCursor)
-            self.remove_btn.setStyleSheet(inactive_style)
 
         # Update clear button
         if has_rows:
             self.clear_btn.setCursor(Qt.ArrowCursor)
             self.clear_btn.setIcon(normal_clear_icon)
-            self.clear_btn.setStyleSheet(active_style)
         else:
             pixmap = normal_clear_icon.pixmap(self.clear_btn.iconSize(), QIcon.Disabled)
             self.clear_btn.setIcon(QIcon(pixmap))
             self.clear_btn.setCursor(Qt.ForbiddenCursor)
-            self.clear_btn.setStyleSheet(inactive_style)
 
     def update_ui_state(self):
         """Update UI state based on jobs."""
@@ -3049,11 +3369,7 @@ class BatchWindow(QMainWindow):
             if idx >= self.table.rowCount():
                 continue
 
-            action_widget = self.table.cellWidget(idx, 5)
-            if not action_widget:
-                continue
-
-            status_label = action_widget.findChild(QLabel)
+            status_label = self.row_status_label(idx)
             if not status_label:
                 continue
 
@@ -3061,11 +3377,7 @@ class BatchWindow(QMainWindow):
                 # Mark as conflict
                 conflict_text = "중복 (스킵)" if tr.current_language == "ko" else "Duplicate (Skip)"
                 status_label.setText(conflict_text)
-                status_label.setStyleSheet(
-                    "background-color: #ffcdd2; border: 1px solid #ef5350; "
-                    "color: #c62828; font-size: 11px; padding: 2px 5px; "
-                    "border-radius: 3px; font-weight: bold;"
-                )
+                set_style_property(status_label, "state", "conflict")
 
                 # Make entire row slightly red
                 for col in range(self.table.columnCount()):
@@ -3077,11 +3389,7 @@ class BatchWindow(QMainWindow):
                 if job.status == "pending" or job.status == "skipped":
                     status_text = "대기 중" if tr.current_language == "ko" else "Pending"
                     status_label.setText(status_text)
-                    status_label.setStyleSheet(
-                        "background-color: #fff9c4; border: 1px solid #fbc02d; "
-                        "color: #8c6b00; font-size: 11px; padding: 2px 5px; "
-                        "border-radius: 3px;"
-                    )
+                    set_style_property(status_label, "state", "pending")
 
                 # Clear row background
                 for col in range(self.table.columnCount()):
@@ -3161,43 +3469,29 @@ class BatchWindow(QMainWindow):
 
             reply = show_message(self, "warning", title, msg)
 
-        # Get keys from settings
-        import json
-        settings_file = Path.home() / ".meta_injector_settings.json"
-
-        # If settings don't exist, show dialog to enter keys
-        if not settings_file.exists():
-            dialog = SimpleKeysDialog(self)
-            if dialog.exec_() != QDialog.Accepted:
+        # Get keys from settings; if they don't exist, show dialog to enter keys
+        if not SETTINGS_FILE.exists():
+            if self.exec_settings_dialog() != QDialog.Accepted:
                 return
 
         # Load settings
         try:
-            print(f"[DEBUG] Loading settings from: {settings_file}")
-            print(f"[DEBUG] File exists: {settings_file.exists()}")
-
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-                print(f"[DEBUG] Settings loaded: {settings}")
-
-                common_key = settings.get('wii_u_common_key', '')
-                title_key_rhythm = settings.get('title_key_rhythm_heaven', '')
-                title_key_xenoblade = settings.get('title_key_xenoblade', '')
-                title_key_galaxy = settings.get('title_key_galaxy2', '')
-
-                print(f"[DEBUG] Common key: {'SET' if common_key else 'NOT SET'}")
-                print(f"[DEBUG] Rhythm key: {'SET' if title_key_rhythm else 'NOT SET'}")
-
-                if not common_key or not title_key_rhythm:
-                    msg = "Wii U Common Key와 Rhythm Heaven 키가 필요합니다!" if tr.current_language == "ko" else "Wii U Common Key and Rhythm Heaven key are required!"
-                    show_message(self, "warning", tr.get("error"), msg)
-                    return
+            settings = load_settings()
+            common_key = settings.get('wii_u_common_key', '')
+            title_key_rhythm = settings.get('title_key_rhythm_heaven', '')
+            title_key_xenoblade = settings.get('title_key_xenoblade', '')
+            title_key_galaxy = settings.get('title_key_galaxy2', '')
+
+            if not common_key or not title_key_rhythm:
+                msg = "Wii U Common Key와 Rhythm Heaven 키가 필요합니다!" if tr.current_language == "ko" else "Wii U Common Key and Rhythm Heaven key are required!"
+                show_message(self, "warning", tr.get("error"), msg)
+                return
 
-                # Use Rhythm Heaven as fallback if others are missing
-                if not title_key_xenoblade:
-                    title_key_xenoblade = title_key_rhythm
-                if not title_key_galaxy:
-                    title_key_galaxy = title_key_rhythm
+            # Use Rhythm Heaven as fallback if others are missing
+            if not title_key_xenoblade:
+                title_key_xenoblade = title_key_rhythm
+            if not title_key_galaxy:
+                title_key_galaxy = title_key_rhythm
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -3205,30 +3499,17 @@ class BatchWindow(QMainWindow):
             show_message(self, "warning", tr.get("error"), msg)
             return
 
-        # Get output directory from settings or use default
-        settings_file = Path.home() / ".meta_injector_settings.json"
-        output_dir = None
-
-        print(f"[DEBUG] Loading settings from: {settings_file}")
+        # Get output directory from the settings loaded above or use default
+        output_dir = settings.get('output_directory', '').strip()
 
-        if settings_file.exists():
+        # Validate the path if it exists
+        if output_dir:
             try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    output_dir = settings.get('output_directory', '').strip()
-                    print(f"[DEBUG] Loaded output_directory from settings: '{output_dir}'")
-
-                    # Validate the path if it exists
-                    if output_dir:
-                        try:
-                            # Check if it's a valid path format
-                            test_path = Path(output_dir)
-                            print(f"[DEBUG] Validated as path: {test_path}")
-                        except Exception as path_err:
-                            print(f"[WARN] Invalid path format in settings: {path_err}")
-                            output_dir = None  # Force use of default
-            except Exception as e:
-                print(f"[DEBUG] Failed to load settings: {e}")
+                # Check if it's a valid path format
+                Path(output_dir)
+            except Exception as path_err:
+                print(f"[WARN] Invalid path format in settings: {path_err}")
+                output_dir = None  # Force use of default
 
         # If no output directory in settings, use default Documents folder
         if not output_dir:
@@ -3246,13 +3527,10 @@ class BatchWindow(QMainWindow):
 
             default_output.mkdir(parents=True, exist_ok=True)
             output_dir = str(default_output)
-            print(f"[DEBUG] No output directory in settings, using default: {output_dir}")
 
         # Normalize and resolve the path to absolute form
         output_dir_path = Path(output_dir).resolve()
         output_dir = str(output_dir_path)
-        print(f"[DEBUG] Final output_dir for build: {output_dir}")
-        print(f"[DEBUG] Output dir exists: {output_dir_path.exists()}")
 
         # Prepare all metadata in main thread (to avoid SQLite threading issues)
         for job in self.jobs:
@@ -3265,7 +3543,6 @@ class BatchWindow(QMainWindow):
 
         # Store output directory for later use (e.g., open folder button)
         self.current_output_dir = output_dir
-        print(f"[DEBUG] Stored current_output_dir: {self.current_output_dir}")
 
         # Start batch builder
         title_keys = {
@@ -3288,7 +3565,6 @@ class BatchWindow(QMainWindow):
             keep_temp_for_debug=self.keep_temp_check.isChecked()
         )
 
-        self.batch_builder.progress_updated.connect(self.on_progress)
         self.batch_builder.job_started.connect(self.on_job_started)
         self.batch_builder.job_finished.connect(self.on_job_finished)
         self.batch_builder.all_finished.connect(self.on_all_finished)
@@ -3297,11 +3573,14 @@ class BatchWindow(QMainWindow):
         self.set_ui_enabled(False)
 
         self.batch_builder.start()
+        self.progress_timer.start()
 
     def stop_build(self):
         """Stop batch build."""
         if self.batch_builder:
             self.batch_builder.stop()
+            # Drop any tick still pending so it can't overwrite the reset below
+            self.batch_builder.take_progress()
             # Reset progress indicators immediately when user stops
             self.progress_bar.setValue(0)
             self.progress_percentage.setVisible(False)
@@ -3310,6 +3589,28 @@ class BatchWindow(QMainWindow):
             else:
                 self.progress_message.setText("Stopped")
 
+    def closeEvent(self, event):
+        """Signal background work to stop and close without waiting for it."""
+        if self.loader_thread:
+            self.loader_thread.stop()
+        if self.batch_builder:
+            self.batch_builder.stop()
+        self.progress_timer.stop()
+        # Drop queued probes/downloads so interpreter exit only waits for
+        # requests already in flight, not for the whole backlog
+        try:
+            _HTTP_POOL.shutdown(wait=False, cancel_futures=True)
+        except TypeError:  # Python 3.8 has no cancel_futures
+            _HTTP_POOL.shutdown(wait=False)
+        event.accept()
+
+    def poll_build_progress(self):
+        """Show the builder's latest progress, if it moved since the last poll."""
+        if self.batch_builder:
+            progress = self.batch_builder.take_progress()
+            if progress is not None:
+                self.on_progress(progress[0], 100, progress[1])
+
     def on_progress(self, current, total, message):
         """Handle progress update."""
         # current is already a percentage (0-100) from batch_builder
@@ -3322,34 +3623,29 @@ class BatchWindow(QMainWindow):
 
     def on_job_started(self, idx, game_name):
         """Handle job started."""
-        if idx < self.table.rowCount():
-            action_widget = self.table.cellWidget(idx, 5)
-            if action_widget: # Check if the widget exists
-                status_label = action_widget.findChild(QLabel)
-                if status_label: # Check if the status label exists within the widget
-                    status_text = "빌드 중..." if tr.current_language == "ko" else "Building..."
-                    status_label.setText(status_text)
-                    status_label.setStyleSheet("background-color: #bbdefb; border: 1px solid #90caf9; color: #1e3a5f; font-size: 11px; padding: 2px 5px; border-radius: 3px;")
+        status_label = self.row_status_label(idx)
+        if status_label:
+            status_text = "빌드 중..." if tr.current_language == "ko" else "Building..."
+            status_label.setText(status_text)
+            set_style_property(status_label, "state", "building")
 
     def on_job_finished(self, idx, success, message):
         """Handle job finished."""
-        if idx < self.table.rowCount():
-            action_widget = self.table.cellWidget(idx, 5)
-            if action_widget:
-                status_label = action_widget.findChild(QLabel)
-                if status_label:
-                    if success:
-                        status_text = "완료" if tr.current_language == "ko" else "Completed"
-                        status_label.setText(status_text)
-                        status_label.setStyleSheet("background-color: #c8e6c9; border: 1px solid #a5d6a7; color: #256029; font-size: 11px; padding: 2px 5px; border-radius: 3px;")
-                    else:
-                        failed_text = "실패" if tr.current_language == "ko" else "Failed"
-                        status_label.setText(f"{failed_text}")
-                        status_label.setToolTip(message) # Add full error to tooltip
-                        status_label.setStyleSheet("background-color: #ffcdd2; border: 1px solid #ef9a9a; color: #b71c1c; font-size: 11px; padding: 2px 5px; border-radius: 3px;")
+        status_label = self.row_status_label(idx)
+        if status_label:
+            if success:
+                status_text = "완료" if tr.current_language == "ko" else "Completed"
+                status_label.setText(status_text)
+                set_style_property(status_label, "state", "completed")
+            else:
+                failed_text = "실패" if tr.current_language == "ko" else "Failed"
+                status_label.setText(f"{failed_text}")
+                status_label.setToolTip(message) # Add full error to tooltip
+                set_style_property(status_label, "state", "failed")
 
     def on_all_finished(self, success_count, total_count):
         """Handle all jobs finished."""
+        self.progress_timer.stop()
         # Re-enable UI after build
         self.set_ui_enabled(True)
 
@@ -3395,16 +3691,9 @@ class BatchWindow(QMainWindow):
             import platform
             output_path = getattr(self, 'current_output_dir', None)
 
-            print(f"[DEBUG] ========== Open Folder Clicked ==========")
-            print(f"[DEBUG] current_output_dir value: {output_path}")
-            print(f"[DEBUG] current_output_dir type: {type(output_path)}")
-
             if output_path:
                 # Convert to Path object and resolve to absolute path
                 output_path_obj = Path(output_path).resolve()
-                print(f"[DEBUG] Resolved path: {output_path_obj}")
-                print(f"[DEBUG] Path exists: {output_path_obj.exists()}")
-                print(f"[DEBUG] Path is dir: {output_path_obj.is_dir() if output_path_obj.exists() else 'N/A'}")
 
                 if not output_path_obj.exists():
                     print(f"[ERROR] Output path does not exist: {output_path_obj}")
@@ -3413,7 +3702,6 @@ class BatchWindow(QMainWindow):
                 else:
                     # Use absolute string path for explorer
                     abs_path_str = str(output_path_obj.absolute())
-                    print(f"[DEBUG] Opening with explorer: {abs_path_str}")
 
                     if platform.system() == 'Windows':
                         # Use /select to open and highlight the folder
@@ -3422,8 +3710,6 @@ class BatchWindow(QMainWindow):
                         subprocess.run(['open', abs_path_str])
                     else:  # Linux
                         subprocess.run(['xdg-open', abs_path_str])
-
-                    print(f"[DEBUG] Explorer command executed")
             else:
                 print("[ERROR] No output_path set in self.current_output_dir!")
                 error_msg = "출력 경로가 설정되지 않았습니다" if tr.current_language == "ko" else "Output path not set"
@@ -3453,14 +3739,12 @@ class BatchWindow(QMainWindow):
                     jobs_to_retry.append(job)
 
                     # Update status label in table
-                    action_widget = self.table.cellWidget(row, 5)
-                    if action_widget:
-                        status_label = action_widget.findChild(QLabel)
-                        if status_label:
-                            status_text = "대기 중" if tr.current_language == "ko" else "Pending"
-                            status_label.setText(status_text)
-                            status_label.setToolTip("")
-                            status_label.setStyleSheet("background-color: #fff9c4; border: 1px solid #fbc02d; color: #8c6b00; font-size: 11px; padding: 2px 5px; border-radius: 3px;")
+                    status_label = self.row_status_label(row)
+                    if status_label:
+                        status_text = "대기 중" if tr.current_language == "ko" else "Pending"
+                        status_label.setText(status_text)
+                        status_label.setToolTip("")
+                        set_style_property(status_label, "state", "pending")
 
         if not jobs_to_retry:
             return
@@ -3471,15 +3755,12 @@ class BatchWindow(QMainWindow):
     def start_build_for_jobs(self, jobs_to_build):
         """Start build process for specific jobs."""
         # Load settings
-        import json
-        settings_path = Path.home() / ".meta_injector_settings.json"
-        if not settings_path.exists():
+        if not SETTINGS_FILE.exists():
             error_msg = "설정 파일을 찾을 수 없습니다" if tr.current_language == "ko" else "Settings file not found"
             show_message(self, "warning", tr.get("error"), error_msg)
             return
 
-        with open(settings_path, 'r') as f:
-            settings = json.load(f)
+        settings = load_settings()
 
         common_key = settings.get('common_key', '')
         if not common_key:
@@ -3521,7 +3802,6 @@ class BatchWindow(QMainWindow):
             auto_icons=self.auto_icons_check.isChecked()
         )
 
-        self.batch_builder.progress_updated.connect(self.on_progress)
         self.batch_builder.job_started.connect(self.on_job_started_by_job)
         self.batch_builder.job_finished.connect(self.on_job_finished_by_job)
         self.batch_builder.all_finished.connect(self.on_all_finished)
@@ -3532,6 +3812,7 @@ class BatchWindow(QMainWindow):
         self.stop_btn.setEnabled(True)
 
         self.batch_builder.start()
+        self.progress_timer.start()
 
     def on_job_started_by_job(self, job_index, game_name):
         """Handle job started signal for retry (uses job object index)."""
@@ -3555,35 +3836,46 @@ class BatchWindow(QMainWindow):
 
     def set_ui_enabled(self, enabled: bool):
         """Enable or disable UI elements during build."""
-        # Disable/enable top buttons
-        self.add_btn.setEnabled(enabled)
-        self.remove_btn.setEnabled(enabled)
-        self.clear_btn.setEnabled(enabled)
-        self.settings_btn.setEnabled(enabled)
-        self.auto_icons_check.setEnabled(enabled)
+        # Toggling the table restyles every cell widget; repaint once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # Disable/enable top buttons
+            self.add_btn.setEnabled(enabled)
+            self.remove_btn.setEnabled(enabled)
+            self.clear_btn.setEnabled(enabled)
+            self.settings_btn.setEnabled(enabled)
+            self.auto_icons_check.setEnabled(enabled)
+
+            # Disable/enable table editing (edit buttons and pad option comboboxes)
+            self.table.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def exec_settings_dialog(self) -> int:
+        """
+        Run the settings dialog, reusing it after the first time.
 
-        # Disable/enable table editing (edit buttons and pad option comboboxes)
-        self.table.setEnabled(enabled)
+        Returns:
+            The dialog result (QDialog.Accepted or Rejected)
+        """
+        if self.settings_dialog is None:
+            self.settings_dialog = SimpleKeysDialog(self)
+        else:
+            self.settings_dialog.load_existing_settings()
+        return self.settings_dialog.exec_()
 
     def show_settings(self):
         """Show settings dialog for encryption keys."""
-        dialog = SimpleKeysDialog(self)
-        if dialog.exec_() == QDialog.Accepted:
+        if self.exec_settings_dialog() == QDialog.Accepted:
             # Reload available bases after settings change
             self.load_available_bases()
 
     def load_available_bases(self):
         """Load available bases from settings file."""
-        import json
-        from pathlib import Path
-
-        settings_file = Path.home() / ".meta_injector_settings.json"
-        if not settings_file.exists():
-            return
-
         try:
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            settings = load_settings()
+            if not settings:
+                return
 
             title_keys = {
                 'Rhythm Heaven Fever (USA)': settings.get('title_key_rhythm_heaven', ''),
@@ -3595,16 +3887,17 @@ class BatchWindow(QMainWindow):
             self.available_bases = {
                 name: key for name, key in title_keys.items() if key
             }
-
-            print(f"[DEBUG] Loaded available bases: {list(self.available_bases.keys())}")
-
         except Exception as e:
             print(f"[WARN] Failed to load available bases: {e}")
 
     def show_compatibility_list(self):
         """Show compatibility list dialog."""
-        dialog = CompatibilityListDialog(self)
-        dialog.exec_()
+        # Building the table for the whole DB is slow, so keep the dialog
+        if self.compat_dialog is None:
+            self.compat_dialog = CompatibilityListDialog(self)
+        else:
+            self.compat_dialog.reload_if_changed()
+        self.compat_dialog.exec_()
 
     def on_pad_option_changed(self, row, index):
         """Handle pad option combobox change."""
@@ -3635,8 +3928,6 @@ class BatchWindow(QMainWindow):
                     # No valid GCT patch found, keep current option
                     print(f"[WARN] Invalid GCT patch index {gct_index} for {job.title_name}")
                     return
-            
-            print(f"[INFO] Pad option for {job.title_name}: {job.pad_option}")
 
             # Update compatibility label/button for Galaxy patches
             self.update_compat_widget_for_galaxy(row, index)
@@ -3691,50 +3982,15 @@ class BatchWindow(QMainWindow):
             # Create mapping button
             mapping_btn = QPushButton()
             mapping_btn.setFixedHeight(22)
+            mapping_btn.setIcon(emoji_icon("🎮"))
             if tr.current_language == "ko":
-                mapping_btn.setText("🎮 매핑 확인")
+                mapping_btn.setText("매핑 확인")
             else:
-                mapping_btn.setText("🎮 View Mapping")
+                mapping_btn.setText("View Mapping")
 
             # Different colors for AllStars (blue) and Nvidia (green)
-            if is_galaxy_allstars:  # AllStars - Blue
-                button_style = """
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5b9bd5, stop:1 #4a8bc2);
-                        color: white;
-                        font-size: 11px;
-                        font-weight: 600;
-                        padding: 4px 8px;
-                        border: 1px solid #3d7ba8;
-                        border-radius: 4px;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #6babe5, stop:1 #5b9bd5);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a8bc2, stop:1 #3d7ba8);
-                    }
-                """
-            else:  # Nvidia - Green
-                button_style = """
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5cb85c, stop:1 #4cae4c);
-                        color: white;
-                        font-size: 11px;
-                        font-weight: 600;
-                        padding: 4px 8px;
-                        border: 1px solid #3d8b3d;
-                        border-radius: 4px;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #6cc76c, stop:1 #5cb85c);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a9d4a, stop:1 #3d8b3d);
-                    }
-                """
-
-            mapping_btn.setStyleSheet(button_style)
+            mapping_btn.setObjectName("mappingButton")
+            mapping_btn.setProperty("patch", "allstars" if is_galaxy_allstars else "nvidia")
             mapping_btn.setCursor(Qt.PointingHandCursor)
 
             # Determine which image to show (0=AllStars, 1=Nvidia)
@@ -3747,18 +4003,20 @@ class BatchWindow(QMainWindow):
             layout.removeWidget(old_widget)
             old_widget.deleteLater()
 
-            # Create CC patch label - no mapping button, just indicate patch exists
+            # Create CC patch badge - no mapping, just indicate patch exists.
+            # A button only so it can show the icon; it ignores the mouse
             if tr.current_language == "ko":
-                cc_label_text = "🎮 GCT 패치 사용"
+                cc_label_text = "GCT 패치 사용"
             else:
-                cc_label_text = "🎮 GCT Patch Active"
+                cc_label_text = "GCT Patch Active"
 
-            cc_label = QLabel(cc_label_text)
-            cc_label.setAlignment(Qt.AlignCenter)
+            cc_label = QPushButton(emoji_icon("🎮"), cc_label_text)
+            cc_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+            cc_label.setFocusPolicy(Qt.NoFocus)
             cc_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             cc_label.setFixedHeight(22)
             # Orange style for CC patches - stands out
-            cc_label.setStyleSheet("background-color: #fff0c8; font-size: 11px; font-weight: 600; padding: 1px 4px; border-radius: 3px; border: 1px solid #e0a020;")
+            cc_label.setObjectName("gctBadge")
 
             layout.insertWidget(0, cc_label)
         else:
@@ -3776,14 +4034,8 @@ class BatchWindow(QMainWindow):
                 compat_label.setFixedHeight(22)
 
                 # Apply styling based on compatibility
-                if 'works' in job.gamepad_compatibility.lower() and 'doesn\'t' not in job.gamepad_compatibility.lower():
-                    compat_label.setStyleSheet("background-color: #c8ffc8; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #80c080;")
-                elif 'classic' in job.gamepad_compatibility.lower() or 'lr' in job.gamepad_compatibility.lower():
-                    compat_label.setStyleSheet("background-color: #ffffc8; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #c0c080;")
-                elif 'unknown' in job.gamepad_compatibility.lower():
-                    compat_label.setStyleSheet("background-color: #dcdcdc; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #a0a0a0;")
-                else:
-                    compat_label.setStyleSheet("background-color: #ffc8c8; font-size: 11px; padding: 1px 4px; border-radius: 3px; border: 1px solid #c08080;")
+                compat_label.setObjectName("compatBadge")
+                compat_label.setProperty("compat", compat_badge_value(job.gamepad_compatibility))
 
                 layout.insertWidget(0, compat_label)
 
@@ -3801,12 +4053,7 @@ class BatchWindow(QMainWindow):
 
         # Column 1: Icon, Column 2: Banner
         if column == 1:  # Icon column
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "아이콘 이미지 선택" if tr.current_language == "ko" else "Select Icon Image",
-                "",
-                "Images (*.png *.jpg *.jpeg);;All Files (*.*)"
-            )
+            file_path = open_file_dialog(self, 'icon')
             if file_path:
                 from pathlib import Path
                 icon_path = Path(file_path)
@@ -3816,12 +4063,7 @@ class BatchWindow(QMainWindow):
                 print(f"[USER EDIT] Icon updated for {job.game_path.name}: {icon_path}")
 
         elif column == 2:  # Banner column
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "배너 이미지 선택" if tr.current_language == "ko" else "Select Banner Image",
-                "",
-                "Images (*.png *.jpg *.jpeg);;All Files (*.*)"
-            )
+            file_path = open_file_dialog(self, 'banner')
             if file_path:
                 from pathlib import Path
                 banner_path = Path(file_path)
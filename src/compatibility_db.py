@@ -1,8 +1,75 @@
 """Compatibility database manager for WiiVC Injector."""
+import functools
+import logging
+import os
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Optional
 
+log = logging.getLogger("wiivc.db")
+
+# Applied once to every new connection to a writable database. WAL lets
+# the dialog keep reading while a save or import is writing. It is stored
+# in the file header and needs -wal/-shm files next to the database, so a
+# read-only location keeps the rollback journal.
+WAL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+# Applied once to every new connection; the larger cache keeps the whole
+# games table in memory.
+CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# search_games statements. Each ends with the same optional region/host
+# filters so their text never changes between calls.
+_SEARCH_FILTERS = """
+    AND (? IS NULL OR g.region = ?)
+    AND (? IS NULL OR g.host_game = ?)
+    ORDER BY g.title, g.region
+"""
+SEARCH_ALL_SQL = "SELECT g.* FROM games g WHERE 1" + _SEARCH_FILTERS
+SEARCH_LIKE_SQL = "SELECT g.* FROM games g WHERE g.title LIKE ?" + _SEARCH_FILTERS
+SEARCH_FTS_SQL = """
+    SELECT g.* FROM games_fts f
+    JOIN games g ON g.id = f.rowid
+    WHERE games_fts MATCH ?
+""" + _SEARCH_FILTERS
+
+# Best single match for a disc title: the whole title as a substring (words
+# in order), an exact match first, then the title with the least extra text
+# (so "Super Mario Galaxy" doesn't pick "... Galaxy 2")
+FIND_BY_TITLE_SQL = """
+    SELECT g.* FROM games g
+    WHERE g.title LIKE ?
+    AND (? IS NULL OR g.region = ?)
+    ORDER BY g.title = ? COLLATE NOCASE DESC, length(g.title), g.title, g.region
+    LIMIT 1
+"""
+
+
+def _is_writable(db_path: Path) -> bool:
+    """
+    Check whether the database and its directory can be written.
+
+    Args:
+        db_path: Database file path
+
+    Returns:
+        True if SQLite can write the file and create its journal files
+    """
+    db_path = Path(db_path)
+    if db_path.exists() and not os.access(db_path, os.W_OK):
+        return False
+    return os.access(db_path.parent, os.W_OK)
+
 
 class CompatibilityDB:
     """Manages game compatibility database with title keys."""
@@ -16,28 +83,80 @@ class CompatibilityDB:
                 resource_db = resources.get_resource_path("compatibility.db")
                 if resource_db and resource_db.exists():
                     db_path = resource_db
-                    print(f"[DB] Using database: {db_path}")
+                    log.info("Using database: %s", db_path)
                 else:
                     # Fallback to user's home directory
                     db_path = Path.home() / ".meta_injector_compatibility.db"
-                    print(f"[DB] Using user database: {db_path}")
+                    log.info("Using user database: %s", db_path)
             except Exception as e:
                 # Fallback to user's home directory
                 db_path = Path.home() / ".meta_injector_compatibility.db"
-                print(f"[DB] Using user database: {db_path}")
+                log.info("Using user database: %s", db_path)
 
         self.db_path = db_path
+        # Bundled DB in a read-only install: read it as-is, never change
+        # its journal mode or schema
+        self.read_only = not _is_writable(db_path)
+        if self.read_only:
+            log.info("Database is read-only: %s", db_path)
         self.conn = None
+        # Connection is shared across threads; SQLite serializes reads,
+        # this keeps our multi-statement writes from interleaving
+        self._write_lock = threading.Lock()
+        self.has_fts = False
+        self._tables_created = False
+        # Bumped by every write; cached reads are valid while it matches
+        self._gen = 0
+        self._host_cache = None
+        self._host_cache_gen = -1
+        self._stats_cache = None
+        self._stats_cache_gen = -1
+        # Point lookups keyed on (generation, ...), so a write leaves the old
+        # entries unreachable until they age out
+        self._lookup_game = functools.lru_cache(maxsize=256)(self._query_game)
+        self._lookup_game_by_id = functools.lru_cache(maxsize=256)(self._query_game_by_id)
+        self._lookup_host_key = functools.lru_cache(maxsize=64)(self._query_host_game_title_key)
         self.create_tables()
 
+    @property
+    def generation(self) -> int:
+        """Write counter; data read earlier is stale once this has changed."""
+        return self._gen
+
+    def invalidate_cache(self):
+        """Drop cached reads after another process (the import script) wrote the DB."""
+        self._gen += 1
+
     def connect(self):
         """Connect to database."""
         if self.conn is None:
-            # Allow SQLite to be used across threads
-            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            # Allow SQLite to be used across threads. Autocommit mode: writes
+            # that need a transaction open one explicitly.
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                        isolation_level=None)
             self.conn.row_factory = sqlite3.Row
+            pragmas = CONNECTION_PRAGMAS if self.read_only else WAL_PRAGMAS + CONNECTION_PRAGMAS
+            for pragma in pragmas:
+                try:
+                    self.conn.execute(pragma)
+                except sqlite3.OperationalError as e:
+                    log.warning("%s failed: %s", pragma, e)
+            if log.isEnabledFor(logging.DEBUG):
+                # Echo every statement only when debugging
+                self.conn.set_trace_callback(log.debug)
         return self.conn
 
+    @contextmanager
+    def _bulk_write_pragmas(self):
+        """Hold off WAL checkpoints during a bulk write, then truncate the WAL."""
+        conn = self.connect()
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        try:
+            yield conn
+        finally:
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def close(self):
         """Close database connection."""
         if self.conn:
@@ -46,9 +165,20 @@ class CompatibilityDB:
 
     def create_tables(self):
         """Create database tables if they don't exist."""
+        if self._tables_created:
+            return
+        self._tables_created = True
+
         conn = self.connect()
         cursor = conn.cursor()
 
+        if self.read_only:
+            # Can't create, migrate or index anything; use the FTS index if
+            # the file already has one
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'games_fts'")
+            self.has_fts = cursor.fetchone() is not None
+            return
+
         # Games table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS games (
@@ -68,38 +198,21 @@ class CompatibilityDB:
             )
         """)
 
-        # Migrate: Add game_id column if it doesn't exist
-        try:
-            cursor.execute("SELECT game_id FROM games LIMIT 1")
-        except sqlite3.OperationalError:
-            # Column doesn't exist, add it
+        # Migrate: add columns missing from databases created by older versions
+        cols = {row['name'] for row in cursor.execute("PRAGMA table_info(games)").fetchall()}
+        if 'game_id' not in cols:
             cursor.execute("ALTER TABLE games ADD COLUMN game_id TEXT")
-            print("Migrated database: added game_id column")
-
-        # Migrate: Add category column if it doesn't exist
-        try:
-            cursor.execute("SELECT category FROM games LIMIT 1")
-        except sqlite3.OperationalError:
-            # Column doesn't exist, add it
+            log.info("Migrated database: added game_id column")
+        if 'category' not in cols:
             cursor.execute("ALTER TABLE games ADD COLUMN category TEXT DEFAULT 'Wii'")
             cursor.execute("UPDATE games SET category = 'Wii' WHERE category IS NULL")
-            print("Migrated database: added category column")
-
-        # Migrate: Add korean_title column if it doesn't exist
-        try:
-            cursor.execute("SELECT korean_title FROM games LIMIT 1")
-        except sqlite3.OperationalError:
-            # Column doesn't exist, add it
+            log.info("Migrated database: added category column")
+        if 'korean_title' not in cols:
             cursor.execute("ALTER TABLE games ADD COLUMN korean_title TEXT")
-            print("Migrated database: added korean_title column")
-
-        # Migrate: Add english_title column if it doesn't exist
-        try:
-            cursor.execute("SELECT english_title FROM games LIMIT 1")
-        except sqlite3.OperationalError:
-            # Column doesn't exist, add it
+            log.info("Migrated database: added korean_title column")
+        if 'english_title' not in cols:
             cursor.execute("ALTER TABLE games ADD COLUMN english_title TEXT")
-            print("Migrated database: added english_title column")
+            log.info("Migrated database: added english_title column")
 
         # Host games table (for quick reference)
         cursor.execute("""
@@ -110,76 +223,227 @@ class CompatibilityDB:
             )
         """)
 
-        conn.commit()
+        # Indexes for the point lookups. UNIQUE(title, region) normally
+        # already provides the (title, region) one. Older databases created
+        # without the constraint get it as a unique index, which the CSV
+        # import's ON CONFLICT(title, region) upsert also needs; duplicates
+        # are dropped first, keeping the newest row like INSERT OR REPLACE.
+        unique_cols = set()
+        for index in cursor.execute("PRAGMA index_list('games')").fetchall():
+            if index['unique']:
+                cols = tuple(r['name'] for r in cursor.execute(
+                    f"PRAGMA index_info('{index['name']}')").fetchall())
+                unique_cols.add(cols)
+        if ('title', 'region') not in unique_cols:
+            cursor.execute("""
+                DELETE FROM games WHERE id NOT IN (
+                    SELECT MAX(id) FROM games GROUP BY title, region
+                )
+            """)
+            if cursor.rowcount > 0:
+                log.info("Migrated database: removed %d duplicate games", cursor.rowcount)
+            cursor.execute("DROP INDEX IF EXISTS idx_games_title_region")
+            cursor.execute("CREATE UNIQUE INDEX idx_games_title_region ON games(title, region)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_game_id ON games(game_id) WHERE game_id IS NOT NULL")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_games_host ON games(host_game)")
+
+        self.has_fts = self._create_fts(cursor)
 
-    def import_from_csv(self, csv_path: Path):
-        """Import compatibility data from CSV file."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        conn.commit()
 
-        # Clear existing data
-        cursor.execute("DELETE FROM games")
+    def _create_fts(self, cursor) -> bool:
+        """Create the FTS5 title index and its sync triggers.
 
-        # Read CSV
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO games
-                    (title, region, game_id, host_game, gamepad_compatibility, status, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row['Title'],
-                    row['Region'],
-                    None,  # game_id will be filled later
-                    row['Host_Game'],
-                    row['Gamepad_Compatibility'],
-                    row['Status'],
-                    row['Notes']
-                ))
-
-        # Extract unique host games
-        cursor.execute("SELECT DISTINCT host_game FROM games")
-        host_games = cursor.fetchall()
-        for host in host_games:
+        Returns:
+            False if this SQLite build has no FTS5, in which case
+            search_games falls back to LIKE.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'games_fts'")
+        existed = cursor.fetchone() is not None
+        try:
             cursor.execute("""
-                INSERT OR IGNORE INTO host_games (name) VALUES (?)
-            """, (host[0],))
+                CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+                    title,
+                    content='games',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            log.warning("FTS5 unavailable, using LIKE search: %s", e)
+            return False
 
-        conn.commit()
-        print(f"Imported {cursor.rowcount} games from {csv_path}")
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS games_ai AFTER INSERT ON games BEGIN
+                INSERT INTO games_fts(rowid, title) VALUES (new.id, new.title);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS games_ad AFTER DELETE ON games BEGIN
+                INSERT INTO games_fts(games_fts, rowid, title) VALUES ('delete', old.id, old.title);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS games_au AFTER UPDATE OF title ON games BEGIN
+                INSERT INTO games_fts(games_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                INSERT INTO games_fts(rowid, title) VALUES (new.id, new.title);
+            END
+        """)
+
+        if not existed:
+            # Index the rows that were there before the FTS table
+            cursor.execute("INSERT INTO games_fts(games_fts) VALUES ('rebuild')")
+        return True
+
+    def import_from_csv(self, csv_path: Path):
+        """Import compatibility data from CSV file.
 
-    def search_games(self, query: str, region: Optional[str] = None) -> List[Dict]:
+        Rows are upserted on (title, region), so game IDs, title keys and
+        user notes learned for a game survive a re-import; games missing
+        from the CSV are removed. The whole import runs in one explicit
+        transaction, so a bad CSV leaves the previous data untouched.
+        """
+        import csv  # Deferred: only the DB update imports CSV data
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            if conn.in_transaction:
+                conn.commit()
+
+            with self._bulk_write_pragmas(), \
+                    open(csv_path, 'r', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                header = {name: i for i, name in enumerate(next(reader, []))}
+                columns = [header[name] for name in (
+                    'Title', 'Region', 'Host_Game',
+                    'Gamepad_Compatibility', 'Status', 'Notes'
+                )]
+                rows = (tuple(row[i] for i in columns) for row in reader if row)
+
+                try:
+                    cursor.execute("BEGIN IMMEDIATE")
+
+                    cursor.execute("""
+                        CREATE TEMP TABLE IF NOT EXISTS csv_import (
+                            title TEXT, region TEXT, host_game TEXT,
+                            gamepad_compatibility TEXT, status TEXT, notes TEXT
+                        )
+                    """)
+                    cursor.execute("DELETE FROM csv_import")
+                    cursor.executemany("""
+                        INSERT INTO csv_import
+                        (title, region, host_game, gamepad_compatibility, status, notes)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """, rows)
+                    # executemany sums rowcount over every row it inserted
+                    imported = cursor.rowcount
+
+                    # Update in place so the row id and learned columns stay
+                    cursor.execute("""
+                        INSERT INTO games
+                        (title, region, host_game, gamepad_compatibility, status, notes)
+                        SELECT title, region, host_game, gamepad_compatibility, status, notes
+                        FROM csv_import WHERE true ORDER BY rowid
+                        ON CONFLICT(title, region) DO UPDATE SET
+                            host_game = excluded.host_game,
+                            gamepad_compatibility = excluded.gamepad_compatibility,
+                            status = excluded.status,
+                            notes = excluded.notes
+                    """)
+
+                    # Drop games that are no longer in the CSV
+                    cursor.execute("""
+                        DELETE FROM games WHERE NOT EXISTS (
+                            SELECT 1 FROM csv_import c
+                            WHERE c.title = games.title AND c.region = games.region
+                        )
+                    """)
+                    cursor.execute("DROP TABLE csv_import")
+
+                    # Extract unique host games
+                    cursor.execute("""
+                        INSERT OR IGNORE INTO host_games (name)
+                        SELECT DISTINCT host_game FROM games
+                    """)
+
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+            # Refresh planner statistics for the new data
+            conn.execute("ANALYZE")
+            conn.commit()
+            self._gen += 1
+
+            log.info("Imported %d games from %s", imported, csv_path)
+
+    def search_games(self, query: str, region: Optional[str] = None,
+                     host: Optional[str] = None) -> List[sqlite3.Row]:
         """
         Search games by title.
 
+        Every word of the query is matched as a prefix of a title word
+        through the FTS index; without FTS5 the whole query is matched as
+        a substring.
+
         Args:
-            query: Search query (title)
+            query: Search query (title), empty for all games
             region: Filter by region (optional)
+            host: Filter by host game (optional)
 
         Returns:
-            List of matching games
+            List of matching games as sqlite3.Row (index by column name;
+            use dict(row) where a mutable copy is needed)
         """
         conn = self.connect()
         cursor = conn.cursor()
 
-        sql = """
-            SELECT * FROM games
-            WHERE title LIKE ?
+        words = re.findall(r'\w+', query)
+        if not query.strip():
+            sql, params = SEARCH_ALL_SQL, []
+        elif self.has_fts and words:
+            sql = SEARCH_FTS_SQL
+            params = [" ".join(f'"{word}"*' for word in words)]
+        else:
+            sql, params = SEARCH_LIKE_SQL, [f"%{query}%"]
+
+        # Optional filters are bound as NULL so the SQL text stays constant
+        # and every call reuses the cached prepared statement
+        region = region or None
+        host = host or None
+        params += [region, region, host, host]
+
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+    def find_game_by_title(self, title: str, region: Optional[str] = None) -> Optional[Dict]:
         """
-        params = [f"%{query}%"]
+        Find the game a disc title most likely refers to.
 
-        if region:
-            sql += " AND region = ?"
-            params.append(region)
+        Unlike search_games, which matches loose word prefixes in any order
+        for interactive filtering, this needs the whole title in order, so
+        a title can't resolve to a different game that shares its words.
 
-        sql += " ORDER BY title, region"
+        Args:
+            title: Title read from the disc
+            region: Filter by region (optional)
 
-        cursor.execute(sql, params)
-        return [dict(row) for row in cursor.fetchall()]
+        Returns:
+            Game info dict or None
+        """
+        region = region or None
+        cursor = self.connect().execute(FIND_BY_TITLE_SQL, (f"%{title}%", region, region, title))
+        row = cursor.fetchone()
+        return dict(row) if row else None
 
     def get_game(self, title: str, region: str) -> Optional[Dict]:
         """Get specific game by title and region."""
+        game = self._lookup_game(self._gen, title, region)
+        return dict(game) if game else None
+
+    def _query_game(self, gen: int, title: str, region: str) -> Optional[Dict]:
         conn = self.connect()
         cursor = conn.cursor()
 
@@ -193,6 +457,10 @@ class CompatibilityDB:
 
     def get_game_by_id(self, game_id: str) -> Optional[Dict]:
         """Get specific game by game ID (title ID)."""
+        game = self._lookup_game_by_id(self._gen, game_id)
+        return dict(game) if game else None
+
+    def _query_game_by_id(self, gen: int, game_id: str) -> Optional[Dict]:
         conn = self.connect()
         cursor = conn.cursor()
 
@@ -207,73 +475,79 @@ class CompatibilityDB:
 
     def update_game_id(self, title: str, region: str, game_id: str):
         """Update game_id for a game (learning system)."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE games
-            SET game_id = ?
-            WHERE title = ? AND region = ?
-        """, (game_id, title, region))
+            cursor.execute("""
+                UPDATE games
+                SET game_id = ?
+                WHERE title = ? AND region = ?
+            """, (game_id, title, region))
 
-        conn.commit()
-        print(f"Learned game ID mapping: {title} ({region}) = {game_id}")
+            conn.commit()
+            self._gen += 1
+            log.info("Learned game ID mapping: %s (%s) = %s", title, region, game_id)
 
     def update_title(self, old_title: str, region: str, new_title: str):
         """Update title for a game."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE games
-            SET title = ?
-            WHERE title = ? AND region = ?
-        """, (new_title, old_title, region))
+            cursor.execute("""
+                UPDATE games
+                SET title = ?
+                WHERE title = ? AND region = ?
+            """, (new_title, old_title, region))
 
-        conn.commit()
-        print(f"Updated title: {old_title} ({region}) -> {new_title}")
+            conn.commit()
+            self._gen += 1
+            log.info("Updated title: %s (%s) -> %s", old_title, region, new_title)
 
     def update_titles(self, game_id: str, korean_title: str = None, english_title: str = None):
         """Update Korean and/or English title for a game by game_id. Insert if not exists."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        # Check if game exists
-        cursor.execute("""
-            SELECT id FROM games WHERE game_id = ? LIMIT 1
-        """, (game_id,))
-
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing record
-            updates = []
-            params = []
-            if korean_title:
-                updates.append("korean_title = ?")
-                params.append(korean_title)
-            if english_title:
-                updates.append("english_title = ?")
-                params.append(english_title)
-
-            if updates:
-                params.append(game_id)
-                cursor.execute(f"""
-                    UPDATE games
-                    SET {', '.join(updates)}
-                    WHERE game_id = ?
-                """, params)
-                print(f"Updated titles for {game_id}: KO={korean_title}, EN={english_title}")
-        else:
-            # Insert new minimal record
-            display_title = korean_title or english_title or game_id
+            # Check if game exists
             cursor.execute("""
-                INSERT INTO games (title, region, game_id, host_game, korean_title, english_title, category)
-                VALUES (?, 'Unknown', ?, 'Rhythm Heaven Fever (USA)', ?, ?, 'Wii')
-            """, (display_title, game_id, korean_title, english_title))
-            print(f"Inserted new game {game_id}: KO={korean_title}, EN={english_title}")
+                SELECT id FROM games WHERE game_id = ? LIMIT 1
+            """, (game_id,))
+
+            existing = cursor.fetchone()
+
+            if existing:
+                # Update existing record
+                updates = []
+                params = []
+                if korean_title:
+                    updates.append("korean_title = ?")
+                    params.append(korean_title)
+                if english_title:
+                    updates.append("english_title = ?")
+                    params.append(english_title)
+
+                if updates:
+                    params.append(game_id)
+                    cursor.execute(f"""
+                        UPDATE games
+                        SET {', '.join(updates)}
+                        WHERE game_id = ?
+                    """, params)
+                    log.info("Updated titles for %s: KO=%s, EN=%s", game_id, korean_title, english_title)
+            else:
+                # Insert new minimal record
+                display_title = korean_title or english_title or game_id
+                cursor.execute("""
+                    INSERT INTO games (title, region, game_id, host_game, korean_title, english_title, category)
+                    VALUES (?, 'Unknown', ?, 'Rhythm Heaven Fever (USA)', ?, ?, 'Wii')
+                """, (display_title, game_id, korean_title, english_title))
+                log.info("Inserted new game %s: KO=%s, EN=%s", game_id, korean_title, english_title)
 
-        conn.commit()
+            conn.commit()
+            self._gen += 1
 
     def update_korean_title(self, game_id: str, korean_title: str):
         """Update Korean title only (for backward compatibility)."""
@@ -281,50 +555,56 @@ class CompatibilityDB:
 
     def update_korean_title_by_title(self, title: str, region: str, korean_title: str):
         """Update Korean title for a game by title and region."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE games
-            SET korean_title = ?
-            WHERE title = ? AND region = ?
-        """, (korean_title, title, region))
+            cursor.execute("""
+                UPDATE games
+                SET korean_title = ?
+                WHERE title = ? AND region = ?
+            """, (korean_title, title, region))
 
-        conn.commit()
+            conn.commit()
+            self._gen += 1
 
     def update_title_key(self, title: str, region: str, title_key: str):
         """Update title key for a game."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE games
-            SET title_key = ?
-            WHERE title = ? AND region = ?
-        """, (title_key, title, region))
+            cursor.execute("""
+                UPDATE games
+                SET title_key = ?
+                WHERE title = ? AND region = ?
+            """, (title_key, title, region))
 
-        conn.commit()
+            conn.commit()
+            self._gen += 1
 
     def update_user_notes(self, title: str, region: str, notes: str):
         """Update user notes for a game."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE games
-            SET user_notes = ?
-            WHERE title = ? AND region = ?
-        """, (notes, title, region))
+            cursor.execute("""
+                UPDATE games
+                SET user_notes = ?
+                WHERE title = ? AND region = ?
+            """, (notes, title, region))
 
-        conn.commit()
+            conn.commit()
+            self._gen += 1
 
-    def get_all_games(self) -> List[Dict]:
+    def get_all_games(self) -> List[sqlite3.Row]:
         """Get all games."""
         conn = self.connect()
         cursor = conn.cursor()
 
         cursor.execute("SELECT * FROM games ORDER BY title, region")
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
 
     def fill_missing_game_ids(self):
         """Fill missing game IDs by searching GameTDB with game titles."""
@@ -378,45 +658,46 @@ class CompatibilityDB:
                 if best_match:
                     self.update_game_id(title, region, best_match)
                     updated_count += 1
-                    print(f"  [DB] Found game ID for '{title}' ({region}): {best_match}")
+                    log.info("Found game ID for '%s' (%s): %s", title, region, best_match)
 
         return updated_count
 
-    def get_games_by_host(self, host_game: str) -> List[Dict]:
+    def get_games_by_host(self, host_game: str) -> List[sqlite3.Row]:
         """Get games by host game."""
-        conn = self.connect()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT * FROM games
-            WHERE host_game = ?
-            ORDER BY title, region
-        """, (host_game,))
-
-        return [dict(row) for row in cursor.fetchall()]
+        return self.search_games("", host=host_game)
 
     def get_host_games(self) -> List[str]:
         """Get list of all host games."""
+        if self._host_cache_gen == self._gen:
+            return list(self._host_cache)
+
         conn = self.connect()
         cursor = conn.cursor()
 
         cursor.execute("SELECT DISTINCT name FROM host_games ORDER BY name")
-        return [row[0] for row in cursor.fetchall()]
+        self._host_cache = [row[0] for row in cursor.fetchall()]
+        self._host_cache_gen = self._gen
+        return list(self._host_cache)
 
     def set_host_game_title_key(self, host_game_name: str, title_key: str):
         """Set default title key for a host game."""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT OR REPLACE INTO host_games (name, default_title_key)
-            VALUES (?, ?)
-        """, (host_game_name, title_key))
+            cursor.execute("""
+                INSERT OR REPLACE INTO host_games (name, default_title_key)
+                VALUES (?, ?)
+            """, (host_game_name, title_key))
 
-        conn.commit()
+            conn.commit()
+            self._gen += 1
 
     def get_host_game_title_key(self, host_game_name: str) -> Optional[str]:
         """Get default title key for a host game."""
+        return self._lookup_host_key(self._gen, host_game_name)
+
+    def _query_host_game_title_key(self, gen: int, host_game_name: str) -> Optional[str]:
         conn = self.connect()
         cursor = conn.cursor()
 
@@ -430,6 +711,9 @@ class CompatibilityDB:
 
     def get_stats(self) -> Dict:
         """Get database statistics."""
+        if self._stats_cache_gen == self._gen:
+            return dict(self._stats_cache)
+
         conn = self.connect()
         cursor = conn.cursor()
 
@@ -442,11 +726,13 @@ class CompatibilityDB:
         cursor.execute("SELECT COUNT(DISTINCT host_game) FROM games")
         total_hosts = cursor.fetchone()[0]
 
-        return {
+        self._stats_cache = {
             'total_games': total_games,
             'games_with_keys': games_with_keys,
             'total_hosts': total_hosts
         }
+        self._stats_cache_gen = self._gen
+        return dict(self._stats_cache)
 
     def _auto_import_csv(self):
         """Auto-import CSV if database is empty."""
@@ -463,13 +749,28 @@ class CompatibilityDB:
                 from .resources import resources
                 csv_path = resources.get_resource_path("compatibility.csv")
                 if csv_path and csv_path.exists():
-                    print(f"[DB] Database empty, importing from {csv_path}")
+                    log.info("Database empty, importing from %s", csv_path)
                     self.import_from_csv(csv_path)
                 else:
-                    print("[DB] Warning: compatibility.csv not found in resources")
+                    log.warning("compatibility.csv not found in resources")
             except Exception as e:
-                print(f"[DB] Error auto-importing CSV: {e}")
+                log.error("Error auto-importing CSV: %s", e)
+
+
+# Global instance, opened on first use
+_instance: Optional[CompatibilityDB] = None
+
+
+def get_compatibility_db(db_path: Path = None) -> CompatibilityDB:
+    """Get or create the global CompatibilityDB instance."""
+    global _instance
+    if _instance is None:
+        _instance = CompatibilityDB(db_path)
+    return _instance
 
 
-# Global instance
-compatibility_db = CompatibilityDB()
+def __getattr__(name):
+    # Keep `from .compatibility_db import compatibility_db` working
+    if name == "compatibility_db":
+        return get_compatibility_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,9 @@ from typing import Optional, Dict
 class GameInfoExtractor:
     """Extract information from game ISO/WBFS files."""
 
+    # extract_game_info() results keyed by (path, size, mtime_ns)
+    _info_cache: Dict[tuple, Dict[str, str]] = {}
+
     @staticmethod
     def read_game_header(iso_path: Path) -> Optional[Dict[str, str]]:
         """
@@ -93,10 +96,8 @@ class GameInfoExtractor:
                 except:
                     game_title = "Unknown"
 
-                # Read game type (8 bytes at offset+0x18)
-                f.seek(offset + 0x18)
-                game_type_bytes = f.read(8)
-                game_type = int.from_bytes(game_type_bytes, byteorder='big', signed=False)
+                # Game type (8 bytes at offset+0x18, already in the header read)
+                game_type = int.from_bytes(header[0x18:0x20], byteorder='big', signed=False)
 
                 print(f"Extracted: ID={game_id}, Title={game_title}, Type={game_type}")
 
@@ -196,15 +197,25 @@ class GameInfoExtractor:
         """
         Extract complete game information.
 
+        Results are cached per path, size and mtime, so re-adding an
+        unchanged file skips the header read and the GameTDB lookup.
+
         Args:
             file_path: Path to game file
 
         Returns:
             Dict with all game info
         """
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except OSError:
             return None
 
+        cache_key = (str(file_path), st.st_size, st.st_mtime_ns)
+        cached = GameInfoExtractor._info_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         info = GameInfoExtractor.read_game_header(file_path)
         if not info:
             return None
@@ -216,7 +227,7 @@ class GameInfoExtractor:
             'file_type': file_type,
             'title_id': title_id,
             'file_path': str(file_path),
-            'file_size': file_path.stat().st_size
+            'file_size': st.st_size
         })
 
         # Fetch localized names and update compatibility DB
@@ -224,7 +235,7 @@ class GameInfoExtractor:
         if game_id and len(game_id) >= 4:
             try:
                 from .game_tdb import GameTdb
-                from .compatibility_db import compatibility_db
+                from .compatibility_db import get_compatibility_db
 
                 # Get localized names from GameTDB
                 names = GameTdb.get_localized_names(game_id)
@@ -239,11 +250,13 @@ class GameInfoExtractor:
 
                 # Update compatibility DB if we have any title info
                 if korean_title or english_title:
-                    compatibility_db.update_titles(game_id, korean_title, english_title)
+                    get_compatibility_db().update_titles(game_id, korean_title, english_title)
 
             except Exception as e:
                 print(f"[GameInfo] Error fetching localized names: {e}")
+                return info  # Not cached, so the lookup is retried next time
 
+        GameInfoExtractor._info_cache[cache_key] = dict(info)
         return info
 
 
@@ -33,11 +33,10 @@ def remove_special_chars(text: str) -> str:
     if not text:
         return text
 
-    # First remove diacritics
-    text = remove_diacritics(text)
-
-    # Keep only ASCII characters
-    return ''.join(char for char in text if ord(char) < 128)
+    # Decompose so accented letters become an ASCII base plus combining marks;
+    # the ASCII codec then drops the marks and every other non-ASCII character
+    # in one C-level pass
+    return unicodedata.normalize('NFD', text).encode('ascii', 'ignore').decode('ascii')
 
 
 def replace_at(text: str, index: int, new_char: str) -> str:
@@ -6,6 +6,10 @@ class Translations:
     # Current language
     current_language = "en"  # Default: English
 
+    # STRINGS resolved for _resolved_language: key -> text (built on first get)
+    _resolved = None
+    _resolved_language = None
+
     # All translations
     STRINGS = {
         # Window titles
@@ -1411,13 +1415,19 @@ class Translations:
         Returns:
             Translated string
         """
-        if key not in cls.STRINGS:
+        if cls._resolved_language != cls.current_language:
+            # One pass over STRINGS per language instead of two dict lookups per call
+            cls._resolved = {
+                name: translations.get(cls.current_language, translations.get("en", name))
+                for name, translations in cls.STRINGS.items()
+            }
+            cls._resolved_language = cls.current_language
+
+        text = cls._resolved.get(key)
+        if text is None:
             print(f"Warning: Translation key '{key}' not found")
             return key
 
-        translations = cls.STRINGS[key]
-        text = translations.get(cls.current_language, translations.get("en", key))
-
         # Apply formatting if kwargs provided
         if kwargs:
             try:
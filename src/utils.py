@@ -85,6 +85,27 @@ def string_to_bytes(hex_string: str) -> bytes:
     return bytes.fromhex(hex_string)
 
 
+def verify_key(key: str) -> bool:
+    """
+    Check that a key is exactly 32 hex digits (case-insensitive, surrounding whitespace stripped).
+
+    Args:
+        key: Common key or title key
+
+    Returns:
+        True if key is well-formed
+    """
+    key = key.strip()
+    # Wii U common/title keys are 16 bytes = 32 hex digits; the length check
+    # also rules out the spaces bytes.fromhex would accept between bytes
+    if len(key) != 32:
+        return False
+    try:
+        return len(bytes.fromhex(key)) == 16
+    except ValueError:
+        return False
+
+
 def bytes_to_hex_string(data: bytes) -> str:
     """
     Convert bytes to hex string.